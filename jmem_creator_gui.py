@@ -9,30 +9,109 @@ Usage:
     python jmem_creator_gui.py
 """
 
+import atexit
+import collections
 import gc
+import io
 import json
+import os
 import shutil
+import struct
 import sys
 import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, NamedTuple
 
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QPalette, QColor
+from PyQt5 import sip
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QSignalBlocker, QElapsedTimer,
+    QAbstractTableModel, QModelIndex, QRunnable, QThreadPool, QSettings,
+)
+from PyQt5.QtGui import QFont, QPalette, QColor, QStandardItemModel, QStandardItem
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QPushButton, QProgressBar, QPlainTextEdit,
     QLineEdit, QFileDialog, QMessageBox, QGroupBox, QCheckBox,
-    QStackedWidget, QFrame, QListWidget, QAbstractItemView, QSpinBox,
-    QTableWidget, QTableWidgetItem, QDialog, QDialogButtonBox,
+    QStackedWidget, QFrame, QListWidget, QListWidgetItem, QAbstractItemView, QSpinBox,
+    QTableView, QDialog, QDialogButtonBox,
     QFormLayout, QHeaderView, QInputDialog,
 )
 from typing import Tuple
 
 import torch
 
+# orjson is optional; JSON I/O falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; lets large JSON indexes be scanned without loading them
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# =============================================================================
+# File I/O
+# =============================================================================
+
+def read_json(path: Path):
+    """Parse a JSON file (with orjson when available)."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write data to path via a fsynced temp file + rename (never a partial file)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_json(path: Path, obj):
+    """Write obj to a JSON file with 2-space indentation (orjson when available)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(obj, indent=2))
+
+
+def clear_directory(path: Path):
+    """
+    Empty a directory without waiting for the delete.
+
+    The directory is renamed to a hidden sibling and recreated empty at once;
+    the old tree is removed by a background thread (non-daemon, so exit waits
+    for it rather than leaving the trash behind).
+    """
+    trash = path.with_name(f".{path.name}.trash.{os.getpid()}.{time.monotonic_ns()}")
+    os.rename(path, trash)
+    path.mkdir(parents=True)
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True},
+        name="clear-directory",
+    ).start()
+
+
+def json_line(obj) -> bytes:
+    """Encode obj as one compact JSONL line (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode('utf-8')
+
+
 # =============================================================================
 # Dynamic Brain Module Loading
 # =============================================================================
@@ -42,7 +121,8 @@ from jcur import CurriculumPack
 
 # Global placeholders - loaded dynamically when brain directory is selected
 BrainAPI = None
-BookLoader = None
+BookLoader = None  # Imported on first book training (see load_book_loader)
+JiyouBrain = None  # Brain singleton class (for clear_instance on cleanup)
 _brain_dir: Optional[Path] = None
 
 # Settings file for persistence
@@ -59,7 +139,11 @@ def load_brain_modules(brain_dir: Path) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    global BrainAPI, BookLoader, _brain_dir
+    global BrainAPI, BookLoader, JiyouBrain, _brain_dir
+
+    # Already imported from this directory
+    if BrainAPI is not None and brain_dir == _brain_dir:
+        return True
 
     # Validate the directory contains expected files
     if not (brain_dir / "api.py").exists():
@@ -77,12 +161,15 @@ def load_brain_modules(brain_dir: Path) -> bool:
         api_module = __import__(f"{module_name}.api", fromlist=['BrainAPI'])
         BrainAPI = api_module.BrainAPI
 
-        # Try to import BookLoader (optional, for PDF training)
+        # BookLoader pulls in the PDF backends; defer it until a book is trained
+        BookLoader = None
+
+        # Cache the brain singleton class so cleanup doesn't re-import it
         try:
-            book_module = __import__(f"{module_name}.tools.book_loader", fromlist=['BookLoader'])
-            BookLoader = book_module.BookLoader
-        except ImportError:
-            BookLoader = None
+            brain_module = __import__(f"{module_name}.brain", fromlist=['JiyouBrain'])
+            JiyouBrain = brain_module.JiyouBrain
+        except (ImportError, AttributeError):
+            JiyouBrain = None
 
         _brain_dir = brain_dir
         return True
@@ -91,6 +178,23 @@ def load_brain_modules(brain_dir: Path) -> bool:
         return False
 
 
+def load_book_loader():
+    """
+    Import BookLoader from the loaded brain directory on first use.
+
+    Returns:
+        The BookLoader class, or None if the brain has no tools/book_loader.py
+    """
+    global BookLoader
+    if BookLoader is None and _brain_dir is not None:
+        try:
+            book_module = __import__(f"{_brain_dir.name}.tools.book_loader", fromlist=['BookLoader'])
+            BookLoader = book_module.BookLoader
+        except ImportError:
+            BookLoader = None
+    return BookLoader
+
+
 def get_brain_dir() -> Optional[Path]:
     """Get the currently loaded brain directory."""
     return _brain_dir
@@ -104,27 +208,44 @@ def get_brain_dir() -> Optional[Path]:
 APP_DIR = Path(__file__).parent
 CURRICULA_DIR = APP_DIR / "curricula"
 
+# manifest path -> (st_mtime_ns, parsed manifest); refreshes only re-parse changed files
+_manifest_cache: Dict[Path, Tuple[int, Dict]] = {}
+
+
+def _read_manifest_cached(manifest: Path) -> Dict:
+    """Parse a pack manifest, reusing the last parse while its mtime is unchanged."""
+    mtime_ns = manifest.stat().st_mtime_ns
+    cached = _manifest_cache.get(manifest)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    data = read_json(manifest)
+    _manifest_cache[manifest] = (mtime_ns, data)
+    return data
+
 
 def find_jcur_packs() -> List[Dict]:
     """Find all .jcur directories in the local curricula folder."""
     jcur_packs = []
-    if not CURRICULA_DIR.exists():
+    # scandir entries carry the file type, so no extra stat per child
+    try:
+        with os.scandir(CURRICULA_DIR) as entries:
+            dirs = [e for e in entries if e.name.endswith('.jcur') and e.is_dir()]
+    except FileNotFoundError:
         return jcur_packs
-    for path in CURRICULA_DIR.glob("*.jcur"):
-        if path.is_dir():
-            manifest = path / "manifest.json"
-            if manifest.exists():
-                try:
-                    with open(manifest) as f:
-                        data = json.load(f)
-                        jcur_packs.append({
-                            'path': path,
-                            'name': data.get('name', path.stem),
-                            'domain': data.get('domain', path.stem),
-                            'total_items': data.get('statistics', {}).get('total_items', 0),
-                        })
-                except Exception:
-                    pass
+    for entry in dirs:
+        path = Path(entry.path)
+        manifest = path / "manifest.json"
+        try:
+            # A missing manifest raises FileNotFoundError from the stat
+            data = _read_manifest_cached(manifest)
+            jcur_packs.append({
+                'path': path,
+                'name': data.get('name', path.stem),
+                'domain': data.get('domain', path.stem),
+                'total_items': data.get('statistics', {}).get('total_items', 0),
+            })
+        except Exception:
+            pass
     return jcur_packs
 
 
@@ -135,30 +256,31 @@ def find_jmem_packs(brain_dir: Optional[Path] = None) -> List[Dict]:
         brain_dir = _brain_dir
     if brain_dir is None:
         return jmem_packs
-    packs_dir = brain_dir / "jmem_packs"
-    if not packs_dir.exists():
+    try:
+        with os.scandir(brain_dir / "jmem_packs") as entries:
+            # Hidden entries include trash left by clear_directory
+            dirs = [Path(e.path) for e in entries if e.is_dir() and not e.name.startswith('.')]
+    except FileNotFoundError:
         return jmem_packs
-    for path in packs_dir.iterdir():
-        if path.is_dir():
-            # Check for JMEM index (indicates trained pack)
-            jmem_index = path / "jmem_index"
-            manifest = path / "manifest.json"
-            if jmem_index.exists() or manifest.exists():
-                try:
-                    name = path.name
-                    total_memories = 0
-                    if manifest.exists():
-                        with open(manifest) as f:
-                            data = json.load(f)
-                            name = data.get('name', path.name)
-                            total_memories = data.get('total_memories', 0)
-                    jmem_packs.append({
-                        'path': path,
-                        'name': name,
-                        'total_memories': total_memories,
-                    })
-                except Exception:
-                    pass
+    for path in dirs:
+        # Check for manifest or JMEM index (indicates trained pack). The manifest
+        # read's own stat doubles as the existence check.
+        name = path.name
+        total_memories = 0
+        try:
+            data = _read_manifest_cached(path / "manifest.json")
+            name = data.get('name', path.name)
+            total_memories = data.get('total_memories', 0)
+        except FileNotFoundError:
+            if not (path / "jmem_index").exists():
+                continue
+        except Exception:
+            continue
+        jmem_packs.append({
+            'path': path,
+            'name': name,
+            'total_memories': total_memories,
+        })
     return jmem_packs
 
 
@@ -166,7 +288,16 @@ def find_jmem_packs(brain_dir: Optional[Path] = None) -> List[Dict]:
 # Progress Save/Load (for resume)
 # =============================================================================
 
+# Fixed binary layout: epoch, lesson_idx, item_idx, correct_count, total_count, saved_at
+_PROGRESS_STRUCT = struct.Struct('<6q')
+
+
 def get_progress_path(jmem_path: Path) -> Path:
+    return jmem_path / "training_progress.bin"
+
+
+def get_legacy_progress_path(jmem_path: Path) -> Path:
+    """Progress file written by older versions (JSON), still honored on resume."""
     return jmem_path / "training_progress.json"
 
 
@@ -175,50 +306,115 @@ def get_log_path(jmem_path: Path) -> Path:
     return jmem_path / "training_log.jsonl"
 
 
-# MEMORY LEAK FIX: Write logs immediately instead of buffering
-# The previous buffer was accumulating and never properly clearing
+# Trial log lines go through one long-lived buffered file per JMEM (the trial
+# dicts are not retained) and reach disk on size or age.
+LOG_FLUSH_INTERVAL = 1024  # Max buffered trials
+LOG_FLUSH_SECONDS = 2.0  # Max staleness for readers tailing the log
+LOG_BUFFER_SIZE = 1 << 20
+
+_log_fp: Optional[io.BufferedWriter] = None
+_log_fp_path: Optional[Path] = None
+_log_pending = 0
+_last_flush = time.monotonic()
+_log_lock = threading.Lock()  # Worker thread and GUI may both flush
+
+
+def _ensure_log_fp(jmem_path: Path) -> io.BufferedWriter:
+    """Open the trial log for jmem_path, reopening if the JMEM changed."""
+    global _log_fp, _log_fp_path
+    if _log_fp is None or _log_fp_path != jmem_path:
+        if _log_fp is not None:
+            _log_fp.close()
+        log_path = get_log_path(jmem_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        _log_fp = open(log_path, 'ab', buffering=LOG_BUFFER_SIZE)
+        _log_fp_path = jmem_path
+    return _log_fp
+
 
 def log_trial(jmem_path: Path, trial_data: Dict):
-    """Write trial result immediately to disk (no buffering to prevent memory leak)."""
-    log_path = get_log_path(jmem_path)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_path, 'a') as f:
-        f.write(json.dumps(trial_data) + '\n')
-    # trial_data goes out of scope immediately after this
+    """Buffer a trial result, flushing on size or age (whichever comes first)."""
+    global _log_pending
+    line = json_line(trial_data)
+    with _log_lock:
+        _ensure_log_fp(jmem_path).write(line)
+        _log_pending += 1
+        due = (_log_pending >= LOG_FLUSH_INTERVAL
+               or time.monotonic() - _last_flush > LOG_FLUSH_SECONDS)
+    if due:
+        flush_log_buffer()
+
+
+def flush_log_buffer(jmem_path: Optional[Path] = None):
+    """Flush buffered trial lines to disk.
+
+    Args:
+        jmem_path: Only flush if this JMEM's log is the open one (default: any)
+    """
+    global _log_pending, _last_flush
+    with _log_lock:
+        _last_flush = time.monotonic()
+        if _log_fp is None or (jmem_path is not None and jmem_path != _log_fp_path):
+            return
+        _log_fp.flush()
+        _log_pending = 0
+
+
+def close_log_file():
+    """Flush and close the trial log (the JMEM directory may be cleared next)."""
+    global _log_fp, _log_fp_path, _log_pending
+    with _log_lock:
+        if _log_fp is not None:
+            _log_fp.close()
+        _log_fp = None
+        _log_fp_path = None
+        _log_pending = 0
 
 
-def flush_log_buffer(jmem_path: Path):
-    """No-op - kept for compatibility but buffering is disabled."""
-    pass
+atexit.register(close_log_file)
+
+
+@lru_cache(maxsize=1)
+def _clock_text(epoch_s: int) -> str:
+    """Local HH:MM:SS for a whole epoch second (log lines in the same second share it)."""
+    return time.strftime("%H:%M:%S", time.localtime(epoch_s))
 
 
 def save_progress(jmem_path: Path, lesson_idx: int, item_idx: int,
                   correct_count: int, total_count: int, epoch: int):
-    progress = {
-        'lesson_idx': lesson_idx,
-        'item_idx': item_idx,
-        'correct_count': correct_count,
-        'total_count': total_count,
-        'epoch': epoch,
-    }
+    data = _PROGRESS_STRUCT.pack(
+        epoch, lesson_idx, item_idx, correct_count, total_count, int(time.time())
+    )
     progress_path = get_progress_path(jmem_path)
     progress_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(progress_path, 'w') as f:
-        json.dump(progress, f, indent=2)
+    atomic_write_bytes(progress_path, data)
 
 
 def load_progress(jmem_path: Path) -> Optional[Dict]:
     progress_path = get_progress_path(jmem_path)
-    if progress_path.exists():
-        with open(progress_path, 'r') as f:
-            return json.load(f)
-    return None
+    try:
+        data = progress_path.read_bytes()
+    except FileNotFoundError:
+        legacy_path = get_legacy_progress_path(jmem_path)
+        if legacy_path.exists():
+            return read_json(legacy_path)
+        return None
+    if len(data) != _PROGRESS_STRUCT.size:
+        return None
+    epoch, lesson_idx, item_idx, correct_count, total_count, _ = _PROGRESS_STRUCT.unpack(data)
+    return {
+        'lesson_idx': lesson_idx,
+        'item_idx': item_idx,
+        'correct_count': correct_count,
+        'total_count': total_count,
+        'epoch': epoch,
+    }
 
 
 def clear_progress(jmem_path: Path):
-    progress_path = get_progress_path(jmem_path)
-    if progress_path.exists():
-        progress_path.unlink()
+    for progress_path in (get_progress_path(jmem_path), get_legacy_progress_path(jmem_path)):
+        if progress_path.exists():
+            progress_path.unlink()
 
 
 def create_or_update_manifest(
@@ -238,8 +434,7 @@ def create_or_update_manifest(
 
     # Load existing manifest if present
     if manifest_path.exists():
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        manifest = read_json(manifest_path)
     else:
         manifest = {
             "name": jcur_name or jmem_path.name,
@@ -259,7 +454,8 @@ def create_or_update_manifest(
             for level in ["episodic", "semantic", "conceptual", "schematic"]:
                 level_path = partition_path / level
                 if level_path.exists():
-                    count = len(list(level_path.glob("*.json"))) + len(list(level_path.glob("*.pt")))
+                    with os.scandir(level_path) as entries:
+                        count = sum(1 for e in entries if e.name.endswith(('.json', '.pt')))
                     if count > 0:
                         memory_counts[partition][level] = count
 
@@ -279,8 +475,11 @@ def create_or_update_manifest(
         jmem_index_path = jmem_path / "jmem_index" / "memories.json"
         if jmem_index_path.exists():
             try:
-                with open(jmem_index_path, 'r') as f:
-                    index_data = json.load(f)
+                if ijson is not None:
+                    with open(jmem_index_path, 'rb') as f:
+                        total_memories = int(next(ijson.items(f, 'stats.total_memories'), 0))
+                else:
+                    index_data = read_json(jmem_index_path)
                     total_memories = index_data.get("stats", {}).get("total_memories", 0)
             except:
                 pass
@@ -299,13 +498,12 @@ def create_or_update_manifest(
     # Record dependencies (base JMEMs used during training)
     if dependencies:
         manifest["dependencies"] = [
-            {"name": Path(p).name, "path": str(p)}
+            {"name": os.path.basename(p), "path": str(p)}
             for p in dependencies
         ]
 
     # Save manifest
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    write_json(manifest_path, manifest)
 
     return manifest
 
@@ -314,12 +512,41 @@ def create_or_update_manifest(
 # Training Worker
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Whether CUDA is usable (queried once per process; it can't change)."""
+    return torch.cuda.is_available()
+
+
+class ProgressState:
+    """
+    Latest training progress, written by a worker thread and polled by the GUI.
+
+    Replaces per-item progress/stats signals: the worker overwrites a single
+    snapshot and the GUI reads it on a timer, so cross-thread traffic is one
+    read per refresh interval regardless of training speed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Tuple[int, int, str, float, int, int]] = None
+
+    def update(self, current: int, total: int, label: str,
+               accuracy: float, correct: int, count: int):
+        """Publish progress (current/total/label) and stats (accuracy/correct/count)."""
+        with self._lock:
+            self._snapshot = (current, total, label, accuracy, correct, count)
+
+    def snapshot(self) -> Optional[Tuple[int, int, str, float, int, int]]:
+        """Get the latest published progress, or None if nothing published yet."""
+        with self._lock:
+            return self._snapshot
+
+
 class TrainingWorker(QThread):
     """Background thread for training."""
 
     log_message = pyqtSignal(str)
-    progress_update = pyqtSignal(int, int, str)  # current, total, lesson_name
-    stats_update = pyqtSignal(float, int, int)   # accuracy, correct, total
     training_finished = pyqtSignal()
     training_error = pyqtSignal(str)
 
@@ -337,7 +564,8 @@ class TrainingWorker(QThread):
         super().__init__()
         self.jmem_path = jmem_path
         self.resume = resume
-        self.use_gpu = use_gpu and torch.cuda.is_available()
+        self._has_cuda = _cuda_available()
+        self.use_gpu = use_gpu and self._has_cuda
         self.source_type = source_type  # "jcur" or "book"
         self.jcur_path = jcur_path
         self.pdf_path = pdf_path
@@ -352,12 +580,26 @@ class TrainingWorker(QThread):
         # Brain reference (for cleanup)
         self.brain: Optional[BrainAPI] = None
 
+        # Progress polled by the GUI (current, total, lesson_name, accuracy, correct, total)
+        self.progress = ProgressState()
+
+        # Problem items log - opened lazily on first failure, closed in _cleanup
+        self._problem_file = None
+
+        # Trial log entry template (copied per item; fixes key order in the JSONL)
+        self._log_template = dict.fromkeys([
+            'session_start', 't_offset_ns', 'epoch', 'lesson_idx', 'lesson_name',
+            'item_idx', 'item_counter', 'item_type', 'target', 'generated',
+            'correct', 'char_accuracy', 'char_correct', 'char_total', 'attempts',
+            'mastery_attempts', 'exact_recall', 'trial_time_ms', 'accuracy',
+            'correct_count', 'total_count',
+        ])
+
         # Training settings (optimized)
         # Reduced encode_steps from 12→6 to reduce recency bias decay
         self.encode_steps = 6
         self.hold_steps = 8
         self.max_retries = 5  # Retries per attempt within train_sequence
-        self.gc_interval = 50
         self.status_interval = 20
 
         # Mastery settings - Jiyou must master each item before proceeding
@@ -373,8 +615,14 @@ class TrainingWorker(QThread):
 
     def log(self, msg: str):
         """Emit timestamped log message."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_message.emit(f"[{timestamp}] {msg}")
+        self.log_message.emit(f"[{_clock_text(int(time.time()))}] {msg}")
+
+    def _write_problem(self, problem_log: Dict):
+        """Append a problem item to problem_items.jsonl (single unbuffered write)."""
+        if self._problem_file is None:
+            problem_path = self.jmem_path / "problem_items.jsonl"
+            self._problem_file = open(problem_path, 'ab', buffering=0)
+        self._problem_file.write(json_line(problem_log))
 
     def stop(self):
         """Request graceful stop."""
@@ -412,6 +660,31 @@ class TrainingWorker(QThread):
         else:
             self._train_jcur()
 
+    def _load_base_jmems(self):
+        """Import base JMEMs as read-only context."""
+        if not self.base_jmems:
+            return
+        self.log(f"Loading {len(self.base_jmems)} base JMEM(s)...")
+
+        # One at a time: import_jmem reads and inserts into the shared index in one call
+        for base_path in self.base_jmems:
+            try:
+                base_jmem = Path(base_path) / "index.jmem"
+                if base_jmem.exists():
+                    # Import as read-only (for retrieval context, not modification)
+                    result = self._import_base_jmem(str(base_path))
+                    imported = result.get('imported', 0) if isinstance(result, dict) else 0
+                    self.log(f"  Loaded base JMEM: {Path(base_path).name} ({imported} memories)")
+                else:
+                    self.log(f"  Skipped {Path(base_path).name} (no index.jmem)")
+            except Exception as e:
+                self.log(f"  Warning: Could not load base JMEM {base_path}: {e}")
+
+    def _import_base_jmem(self, base_path: str):
+        """Import one base JMEM read-only (no autograd: nothing here is trained)."""
+        with torch.no_grad():
+            return self.brain.import_jmem(base_path, read_only=True)
+
     def _train_jcur(self):
         """Train on JCUR curriculum pack."""
         # Load JCUR pack
@@ -445,20 +718,7 @@ class TrainingWorker(QThread):
                 self.log(f"JMEM Index loaded: {stats['total_memories']} memories")
 
         # Load base JMEMs (read-only context for training)
-        if self.base_jmems:
-            self.log(f"Loading {len(self.base_jmems)} base JMEM(s)...")
-            for base_path in self.base_jmems:
-                try:
-                    base_jmem = Path(base_path) / "index.jmem"
-                    if base_jmem.exists():
-                        # Import as read-only (for retrieval context, not modification)
-                        result = self.brain.import_jmem(str(base_path), read_only=True)
-                        imported = result.get('imported', 0) if isinstance(result, dict) else 0
-                        self.log(f"  Loaded base JMEM: {Path(base_path).name} ({imported} memories)")
-                    else:
-                        self.log(f"  Skipped {Path(base_path).name} (no index.jmem)")
-                except Exception as e:
-                    self.log(f"  Warning: Could not load base JMEM {base_path}: {e}")
+        self._load_base_jmems()
 
         # Check for resume
         start_epoch = 0
@@ -481,10 +741,27 @@ class TrainingWorker(QThread):
 
         self.log("Training started...")
 
+        # Wall-clock anchor for trial log timestamps: each entry records an
+        # integer offset from this anchor instead of formatting the time per item
+        # (wall time = session_start + t_offset_ns).
+        session_start_ns = time.perf_counter_ns()
+        session_start = datetime.now()
+        self._log_template['session_start'] = session_start.isoformat()
+
         current_epoch = start_epoch
         current_lesson_idx = start_lesson_idx
         current_item_idx = start_item_idx
 
+        # Loop-invariant settings as locals (read every item / mastery attempt)
+        mastery_required = self.mastery_required
+        mastery_max_attempts = self.mastery_max_attempts
+        max_retries = self.max_retries
+        encode_steps = self.encode_steps
+        hold_steps = self.hold_steps
+        status_interval = self.status_interval
+        jmem_stats_interval = self.jmem_stats_interval
+        jmem_save_interval = self.jmem_save_interval
+
         epochs = 1
 
         for epoch in range(start_epoch, epochs):
@@ -500,7 +777,8 @@ class TrainingWorker(QThread):
 
                 current_lesson_idx = lesson_idx
                 lesson = pack.get_lesson(lesson_id)
-                lesson_name = f"{lesson.title} ({lesson_idx + 1}/{len(lesson_ids)})"
+                lesson_title = lesson.title
+                lesson_name = f"{lesson_title} ({lesson_idx + 1}/{len(lesson_ids)})"
                 self.log(f"Lesson: {lesson_name}")
 
                 # Start learning session
@@ -543,9 +821,9 @@ class TrainingWorker(QThread):
                     # Keep training on this item until mastered or max attempts reached
                     mastery_attempt = 0
                     mastered = False
-                    item_start_time = time.time()
+                    item_start_ns = time.perf_counter_ns()
 
-                    while not mastered and mastery_attempt < self.mastery_max_attempts:
+                    while not mastered and mastery_attempt < mastery_max_attempts:
                         if self._stop_flag:
                             break
 
@@ -564,16 +842,14 @@ class TrainingWorker(QThread):
                         mastery_attempt += 1
 
                         # Train full sequence (all logic in BrainAPI)
-                        trial_start = time.time()
                         result = self.brain.train_sequence(
                             input_text=encode_text,
                             target_text=target_text,
-                            max_retries=self.max_retries,
-                            encode_steps=self.encode_steps,
-                            hold_steps=self.hold_steps,
+                            max_retries=max_retries,
+                            encode_steps=encode_steps,
+                            hold_steps=hold_steps,
                         )
 
-                        trial_time = time.time() - trial_start
                         correct = result['success']
 
                         # Check if mastered (success or exact recall)
@@ -585,47 +861,51 @@ class TrainingWorker(QThread):
                         if mastery_attempt % 100 == 0 and not mastered:
                             self.log(f"  Mastery attempt {mastery_attempt}: acc={result['char_accuracy']:.0%}")
 
-                        # GC EVERY attempt to prevent memory accumulation during long mastery loops
-                        gc.collect(0)
-                        if torch.cuda.is_available() and mastery_attempt % 10 == 0:
-                            torch.cuda.empty_cache()
+                        # Sweep gen0 and release cached GPU blocks during long mastery loops
+                        if mastery_attempt % 10 == 0:
+                            gc.collect(0)
+                            if self._has_cuda:
+                                torch.cuda.empty_cache()
 
                         # Skip mastery loop if not required (single attempt mode)
-                        if not self.mastery_required:
+                        if not mastery_required:
                             break
 
-                    # Calculate total time for this item
-                    total_item_time = time.time() - item_start_time
+                    # Calculate total time for this item (monotonic, integer ns)
+                    total_item_ns = time.perf_counter_ns() - item_start_ns
 
                     # Update stats (count item once, not per mastery attempt)
                     total_count += 1
                     if mastered:
                         correct_count += 1
 
+                    # Truncate once per item (shared by trial and problem logs)
+                    target_short = target_text[:100]
+                    generated_short = result['generated'][:100]
+
                     # Log detailed trial data (for Claude monitoring)
                     accuracy = correct_count / total_count if total_count > 0 else 0
-                    log_data = {
-                        'timestamp': datetime.now().isoformat(),
-                        'epoch': epoch,
-                        'lesson_idx': lesson_idx,
-                        'lesson_name': lesson.title,
-                        'item_idx': item_idx,
-                        'item_counter': item_counter,
-                        'item_type': item.type,
-                        'target': target_text[:100],  # Truncate to prevent memory bloat
-                        'generated': result['generated'][:100],  # Truncate to prevent memory bloat
-                        'correct': mastered,  # Final mastery status
-                        'char_accuracy': result['char_accuracy'],
-                        'char_correct': result['char_correct'],
-                        'char_total': result['char_total'],
-                        'attempts': result['attempts'],
-                        'mastery_attempts': mastery_attempt,  # NEW: total mastery attempts
-                        'exact_recall': result['exact_recall'],
-                        'trial_time_ms': round(total_item_time * 1000, 1),
-                        'accuracy': round(accuracy, 4),
-                        'correct_count': correct_count,
-                        'total_count': total_count,
-                    }
+                    log_data = self._log_template.copy()
+                    log_data['t_offset_ns'] = time.perf_counter_ns() - session_start_ns
+                    log_data['epoch'] = epoch
+                    log_data['lesson_idx'] = lesson_idx
+                    log_data['lesson_name'] = lesson_title
+                    log_data['item_idx'] = item_idx
+                    log_data['item_counter'] = item_counter
+                    log_data['item_type'] = item.type
+                    log_data['target'] = target_short  # Truncate to prevent memory bloat
+                    log_data['generated'] = generated_short  # Truncate to prevent memory bloat
+                    log_data['correct'] = mastered  # Final mastery status
+                    log_data['char_accuracy'] = result['char_accuracy']
+                    log_data['char_correct'] = result['char_correct']
+                    log_data['char_total'] = result['char_total']
+                    log_data['attempts'] = result['attempts']
+                    log_data['mastery_attempts'] = mastery_attempt  # Total mastery attempts
+                    log_data['exact_recall'] = result['exact_recall']
+                    log_data['trial_time_ms'] = (total_item_ns // 100_000) / 10
+                    log_data['accuracy'] = round(accuracy, 4)
+                    log_data['correct_count'] = correct_count
+                    log_data['total_count'] = total_count
                     if item.type == "dialogue":
                         log_data['source'] = encode_text
                     log_trial(self.jmem_path, log_data)
@@ -633,53 +913,52 @@ class TrainingWorker(QThread):
                     # Log mastery result
                     if mastered and mastery_attempt > 1:
                         self.log(f"  ✓ Mastered '{target_text[:30]}' after {mastery_attempt} attempts")
-                    elif not mastered and self.mastery_required:
+                    elif not mastered and mastery_required:
                         # Flag as problematic - something is wrong if we can't learn after 500 attempts
                         self.log(f"  ⚠️ PROBLEM: Failed to master '{target_text[:50]}' after {mastery_attempt} attempts - SKIPPING")
                         self.log(f"     Last output: '{result['generated'][:50]}' ({result['char_accuracy']:.0%} accuracy)")
                         # Log to file for later review
                         problem_log = {
-                            'timestamp': datetime.now().isoformat(),
-                            'lesson': lesson.title,
+                            'timestamp': (session_start + timedelta(
+                                microseconds=(time.perf_counter_ns() - session_start_ns) // 1000
+                            )).isoformat(timespec='milliseconds'),
+                            'lesson': lesson_title,
                             'item_idx': item_idx,
-                            'target': target_text[:100],  # Truncate to prevent memory bloat
-                            'last_generated': result['generated'][:100],  # Truncate to prevent memory bloat
+                            'target': target_short,  # Truncate to prevent memory bloat
+                            'last_generated': generated_short,  # Truncate to prevent memory bloat
                             'char_accuracy': result['char_accuracy'],
                             'mastery_attempts': mastery_attempt,
                         }
-                        problem_path = self.jmem_path / "problem_items.jsonl"
-                        with open(problem_path, 'a') as f:
-                            f.write(json.dumps(problem_log) + '\n')
-
-                    # Emit progress
-                    self.progress_update.emit(item_counter, total_items, lesson_name)
+                        self._write_problem(problem_log)
 
-                    # Emit stats (accuracy already calculated above)
-                    self.stats_update.emit(accuracy, correct_count, total_count)
-
-                    # Interval GC (gen0 only - fast)
-                    if item_counter % self.gc_interval == 0:
-                        gc.collect(0)
+                    # Publish progress and stats (accuracy already calculated above)
+                    self.progress.update(
+                        item_counter, total_items, lesson_name,
+                        accuracy, correct_count, total_count,
+                    )
 
                     # Periodic status log
-                    if item_counter % self.status_interval == 0:
+                    if item_counter % status_interval == 0:
                         self.log(f"Item {item_counter}: acc={accuracy:.1%}")
 
                     # Periodic JMEM stats
-                    if item_counter % self.jmem_stats_interval == 0 and self.brain._jmem_index:
+                    if item_counter % jmem_stats_interval == 0 and self.brain._jmem_index:
                         jmem_stats = self.brain.get_jmem_index_stats()
                         if jmem_stats:
                             content_emb_count = jmem_stats.get('content_embedding_count', 0)
                             self.log(f"  📚 JMEM: {jmem_stats['total_memories']} memories, {content_emb_count} hub states")
 
-                    # Periodic JMEM save (crash recovery)
-                    if item_counter % self.jmem_save_interval == 0 and self.brain._jmem_index:
-                        jmem_file = self.jmem_path / "index.jmem"
+                    # Periodic JMEM save (crash recovery). Skipped when the run is about
+                    # to end anyway: the final save below would just rewrite it.
+                    final_save_due = self._stop_flag or item_counter >= total_items
+                    if (item_counter % jmem_save_interval == 0 and not final_save_due
+                            and self.brain._jmem_index):
                         self.brain.save_jmem_index(str(jmem_file))
 
                 # End lesson
                 self.brain.end_learning_session()
-                gc.collect()  # Full GC at safe point
+
+            gc.collect()  # Full GC at safe point (end of epoch)
 
             # Reset for next epoch
             start_lesson_idx = 0
@@ -698,7 +977,6 @@ class TrainingWorker(QThread):
 
         # Save JMEM index
         if self.brain and self.brain._jmem_index:
-            jmem_file = self.jmem_path / "index.jmem"
             self.brain.save_jmem_index(str(jmem_file))
             stats = self.brain.get_jmem_index_stats()
             self.log(f"Saved JMEM index: {stats['total_memories']} memories")
@@ -709,30 +987,17 @@ class TrainingWorker(QThread):
 
     def _train_book(self):
         """Train on PDF/TXT book using self-supervised learning."""
-        global BookLoader
-        if BookLoader is None:
+        book_loader_cls = load_book_loader()
+        if book_loader_cls is None:
             raise RuntimeError("BookLoader not available. Select a brain directory with tools/book_loader.py")
 
-        # Load and preprocess book
-        loader = BookLoader()
+        # Load and preprocess book in the background while the brain initializes
+        loader = book_loader_cls()
         book_name = Path(self.pdf_path).stem
         self.log(f"Loading book: {book_name}")
-
-        try:
-            raw_text = loader.load(self.pdf_path)
-        except Exception as e:
-            self.log(f"Error loading book: {e}")
-            raise
-
-        text = loader.preprocess(raw_text)
-        chunks = loader.get_training_chunks(
-            text,
-            chunk_size=self.chunk_size,
-            overlap=self.chunk_overlap,
-        )
-        total_chunks = len(chunks)
-
-        self.log(f"Book loaded: {len(raw_text):,} chars → {total_chunks:,} chunks")
+        book_executor = ThreadPoolExecutor(max_workers=1)
+        book_future = book_executor.submit(self._load_book_text, loader)
+        book_executor.shutdown(wait=False)
 
         # Initialize brain
         device = 'cuda' if self.use_gpu else 'cpu'
@@ -754,19 +1019,17 @@ class TrainingWorker(QThread):
             self.log(f"JMEM loaded: {stats['total_memories']} existing memories")
 
         # Load base JMEMs (read-only context for training)
-        if self.base_jmems:
-            self.log(f"Loading {len(self.base_jmems)} base JMEM(s)...")
-            for base_path in self.base_jmems:
-                try:
-                    base_jmem = Path(base_path) / "index.jmem"
-                    if base_jmem.exists():
-                        result = self.brain.import_jmem(str(base_path), read_only=True)
-                        imported = result.get('imported', 0) if isinstance(result, dict) else 0
-                        self.log(f"  Loaded base JMEM: {Path(base_path).name} ({imported} memories)")
-                    else:
-                        self.log(f"  Skipped {Path(base_path).name} (no index.jmem)")
-                except Exception as e:
-                    self.log(f"  Warning: Could not load base JMEM {base_path}: {e}")
+        self._load_base_jmems()
+
+        # Join the book load
+        try:
+            raw_len, chunks = book_future.result()
+        except Exception as e:
+            self.log(f"Error loading book: {e}")
+            raise
+        total_chunks = len(chunks)
+
+        self.log(f"Book loaded: {raw_len:,} chars → {total_chunks:,} chunks")
 
         # Load progress if resuming
         start_chunk = 0
@@ -779,8 +1042,10 @@ class TrainingWorker(QThread):
         # Train on each chunk
         total_loss = 0.0
         chunks_trained = 0
+        jmem_stats = None  # Latest index stats (None once a chunk is stored after them)
 
-        for chunk_idx in range(start_chunk, total_chunks):
+        # Chunk boundaries come from the loader, so resume indices match its chunking
+        for chunk_idx, chunk in enumerate(islice(chunks, start_chunk, None), start_chunk):
             if self._stop_flag:
                 break
 
@@ -789,25 +1054,13 @@ class TrainingWorker(QThread):
             if self._stop_flag:
                 break
 
-            chunk = chunks[chunk_idx]
-
             # Self-supervised training: predict each character in the chunk
-            chunk_loss = 0.0
-            for i in range(1, len(chunk)):
-                context = chunk[:i]
-                target_char = chunk[i]
-                try:
-                    loss = self.brain.decoder.learn_predictive(context, target_char)
-                    chunk_loss += loss
-                except Exception as e:
-                    self.log(f"Warning: Error in learn_predictive at pos {i}: {e}")
-                    continue
-
-            avg_loss = chunk_loss / max(1, len(chunk) - 1)
+            avg_loss = self._learn_chunk(chunk)
             total_loss += avg_loss
             chunks_trained += 1
 
             # Store chunk in JMEM as knowledge
+            jmem_stats = None
             try:
                 self.brain.store_in_jmem(
                     content=chunk,
@@ -822,9 +1075,10 @@ class TrainingWorker(QThread):
 
             # Progress updates
             if chunk_idx % 10 == 0 or chunk_idx == total_chunks - 1:
-                self.progress_update.emit(chunk_idx + 1, total_chunks, f"Chunk {chunk_idx}")
-                current_avg = total_loss / max(1, chunks_trained)
-                self.stats_update.emit(0.0, chunks_trained, chunk_idx + 1)
+                self.progress.update(
+                    chunk_idx + 1, total_chunks, f"Chunk {chunk_idx}",
+                    0.0, chunks_trained, chunk_idx + 1,
+                )
                 self.log(f"Chunk {chunk_idx + 1}/{total_chunks}: avg_loss={avg_loss:.3f}")
 
             # Periodic JMEM stats
@@ -833,16 +1087,15 @@ class TrainingWorker(QThread):
                 if jmem_stats:
                     self.log(f"  📚 JMEM: {jmem_stats['total_memories']} memories")
 
-            # Periodic JMEM save and progress checkpoint
-            if chunk_idx % self.jmem_save_interval == 0:
+            # Periodic JMEM save and progress checkpoint. Skipped when the run is about
+            # to end anyway: the final save and progress write below would redo them.
+            final_save_due = self._stop_flag or chunk_idx == total_chunks - 1
+            if chunk_idx % self.jmem_save_interval == 0 and not final_save_due:
+                # Progress is written after the index so a resume never skips unsaved chunks
                 if self.brain._jmem_index:
                     self.brain.save_jmem_index(str(jmem_file))
                 save_progress(self.jmem_path, 0, chunk_idx, chunks_trained, chunk_idx, 0)
 
-            # Periodic GC
-            if chunk_idx % self.gc_interval == 0:
-                gc.collect(0)
-
         # Training complete
         if not self._stop_flag:
             clear_progress(self.jmem_path)
@@ -854,28 +1107,65 @@ class TrainingWorker(QThread):
         # Save JMEM index
         if self.brain and self.brain._jmem_index:
             self.brain.save_jmem_index(str(jmem_file))
-            stats = self.brain.get_jmem_index_stats()
+            # Stats taken after the last stored chunk still describe the saved index
+            stats = jmem_stats or self.brain.get_jmem_index_stats()
             self.log(f"Saved JMEM index: {stats['total_memories']} memories")
 
         # Final stats
         overall_avg_loss = total_loss / max(1, chunks_trained)
         self.log(f"Final: {chunks_trained} chunks, avg_loss={overall_avg_loss:.3f}")
 
+    def _load_book_text(self, loader) -> Tuple[int, List[str]]:
+        """Load, preprocess and chunk the book (runs on a helper thread)."""
+        raw_text = loader.load(self.pdf_path)
+        text = loader.preprocess(raw_text)
+        chunks = loader.get_training_chunks(
+            text,
+            chunk_size=self.chunk_size,
+            overlap=self.chunk_overlap,
+        )
+        return len(raw_text), chunks
+
+    def _learn_chunk(self, chunk: str) -> float:
+        """
+        Predictive training on one chunk (each character from its prefix).
+
+        Args:
+            chunk: Text chunk
+
+        Returns:
+            Average loss over the chunk's predicted positions
+        """
+        chunk_loss = 0.0
+        for i in range(1, len(chunk)):
+            context = chunk[:i]
+            target_char = chunk[i]
+            try:
+                loss = self.brain.decoder.learn_predictive(context, target_char)
+                chunk_loss += loss
+            except Exception as e:
+                self.log(f"Warning: Error in learn_predictive at pos {i}: {e}")
+                continue
+        return chunk_loss / max(1, len(chunk) - 1)
+
     def _cleanup(self):
         """Clean up resources."""
-        # Flush any remaining buffered logs before cleanup
-        flush_log_buffer(self.jmem_path)
+        # Flush any remaining buffered logs and release the log file
+        close_log_file()
+        if self._problem_file is not None:
+            self._problem_file.close()
+            self._problem_file = None
         if self.brain:
             # Clear the singleton instance to release all brain memory
             try:
-                from JiYouBrain.brain import JiyouBrain
-                JiyouBrain.clear_instance()
+                if JiyouBrain is not None:
+                    JiyouBrain.clear_instance()
             except Exception as e:
                 self.log(f"Warning: Could not clear brain singleton: {e}")
             self.brain = None
         gc.collect()
         # Free GPU memory
-        if torch.cuda.is_available():
+        if self._has_cuda:
             torch.cuda.empty_cache()
 
 
@@ -883,22 +1173,24 @@ class TrainingWorker(QThread):
 # Pool Training Worker (Multi-Brain Parallel Training)
 # =============================================================================
 
+# Shared read-only fallback for missing BrainPool stats sections
+_EMPTY_STATS: Dict = {}
+
+
 class PoolTrainingWorker(QThread):
     """Training worker that uses BrainPool for parallel training."""
 
     log_message = pyqtSignal(str)
-    progress_update = pyqtSignal(int, int, str)  # current, total, status
-    stats_update = pyqtSignal(float, int, int)   # accuracy, correct, total
     worker_stats = pyqtSignal(list)  # Per-worker stats list
     training_finished = pyqtSignal()
     training_error = pyqtSignal(str)
 
     def __init__(
         self,
-        worker_configs: List[Tuple[str, int, bool]],  # (device, neurons, is_big_brain)
+        worker_configs: Tuple[Tuple[str, int, bool], ...],  # (device, neurons, is_big_brain)
         jcur_path: Path,
         jmem_path: Path,
-        base_jmems: List[str],
+        base_jmems: Tuple[str, ...],
         skip_trained: bool = True,
         parent=None,
     ):
@@ -911,6 +1203,13 @@ class PoolTrainingWorker(QThread):
 
         self._pool = None
         self._stop_flag = False
+        self._has_cuda = _cuda_available()
+
+        # Progress polled by the GUI (completed, total, status, accuracy, success, total)
+        self.progress = ProgressState()
+
+        # Last per-worker stats sent to the GUI (unchanged ticks aren't re-sent)
+        self._last_worker_stats: Optional[List[Dict]] = None
 
     def run(self):
         """Main training loop using BrainPool."""
@@ -947,8 +1246,9 @@ class PoolTrainingWorker(QThread):
                 if self._stop_flag:
                     return
 
-                total = stats.get('queue', {}).get('total', 0)
-                completed = stats.get('queue', {}).get('completed', 0)
+                queue = stats.get('queue') or _EMPTY_STATS
+                total = queue.get('total', 0)
+                completed = queue.get('completed', 0)
                 success = stats.get('success', 0)
                 failed = stats.get('failed', 0)
 
@@ -956,10 +1256,17 @@ class PoolTrainingWorker(QThread):
                 total_items = success + failed
                 accuracy = success / total_items if total_items > 0 else 0.0
 
-                # Emit progress
-                self.progress_update.emit(completed, total, f"{progress:.0%}")
-                self.stats_update.emit(accuracy, success, total_items)
-                self.worker_stats.emit(stats.get('per_worker', []))
+                # Publish progress (polled by the GUI) and per-worker stats
+                self.progress.update(
+                    completed, total, f"{progress:.0%}",
+                    accuracy, success, total_items,
+                )
+                # Idle workers repeat identical stats; only cross threads on a change.
+                # Copied so in-place updates by the pool can't mask a change.
+                per_worker = [dict(w) for w in stats.get('per_worker') or ()]
+                if per_worker != self._last_worker_stats:
+                    self._last_worker_stats = per_worker
+                    self.worker_stats.emit(per_worker)
 
             # Run training
             stats = self._pool.train_curriculum(
@@ -1009,61 +1316,327 @@ class PoolTrainingWorker(QThread):
         """Clean up resources."""
         self._pool = None
         gc.collect()
-        if torch.cuda.is_available():
+        if self._has_cuda:
             torch.cuda.empty_cache()
 
 
+# =============================================================================
+# Worker Table Model
+# =============================================================================
+
+class WorkerTableModel(QAbstractTableModel):
+    """
+    Table model for the worker configuration/status table.
+
+    Holds display strings for each worker row. Cell updates emit a targeted
+    dataChanged instead of replacing widget items, and only visible cells are
+    queried by the view.
+    """
+
+    COLUMNS = ["Device", "Neurons", "Type", "Status", "Current Item", "Attempts"]
+    COL_STATUS = 3
+    COL_CURRENT_ITEM = 4
+    COL_ATTEMPTS = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[List[str]] = []
+        # (device, neurons, is_big_brain) -> formatted (Device, Neurons, Type) cells
+        self._config_cells: Dict[Tuple[str, int, bool], Tuple[str, str, str]] = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_configs(self, worker_configs: List[Tuple[str, int, bool]]):
+        """Replace all rows from (device, neurons, is_big_brain) configs."""
+        rows = [[*self._format_config(config), "Ready", "", ""] for config in worker_configs]
+        if rows and len(rows) == len(self._rows):
+            # Same shape: rewrite in place (keeps the view's selection and scroll)
+            self._rows = rows
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(rows) - 1, len(self.COLUMNS) - 1), [Qt.DisplayRole]
+            )
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def _format_config(self, config) -> Tuple[str, str, str]:
+        """Get the display cells for a config, formatting each distinct config once."""
+        key = tuple(config)
+        cells = self._config_cells.get(key)
+        if cells is None:
+            device, neurons, is_big_brain = key
+            cells = (device, f"{neurons:,}", "Big Brain" if is_big_brain else "Normal")
+            self._config_cells[key] = cells
+        return cells
+
+    def cell(self, row: int, column: int) -> str:
+        """Get the display text of a cell."""
+        return self._rows[row][column]
+
+    def set_cell(self, row: int, column: int, text: str):
+        """Set a cell's text, notifying the view only if it changed."""
+        if self._rows[row][column] == text:
+            return
+        self._rows[row][column] = text
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def update_status(self, row: int, status: str):
+        """Set the Status column of a row."""
+        self.set_cell(row, self.COL_STATUS, status)
+
+    def fill_column(self, column: int, text: str):
+        """Set a column to the same text in every row (one dataChanged)."""
+        if all(row[column] == text for row in self._rows):
+            return  # Also covers an empty table
+        for row in self._rows:
+            row[column] = text
+        self.dataChanged.emit(
+            self.index(0, column), self.index(len(self._rows) - 1, column), [Qt.DisplayRole]
+        )
+
+
 # =============================================================================
 # Add Worker Dialog
 # =============================================================================
 
+class WorkerConfig(NamedTuple):
+    """Worker configuration chosen in AddWorkerDialog."""
+    device: str  # "GPU" or "CPU"
+    neurons: int
+    is_big_brain: bool
+
+
 class AddWorkerDialog(QDialog):
-    """Dialog for adding a new worker configuration."""
+    """Dialog for adding a new worker configuration.
+
+    The widget tree is built once and reused: use get_or_create() instead of
+    constructing a new dialog each time "Add Worker" is clicked.
+    """
+
+    _cached_dialog: Optional["AddWorkerDialog"] = None
+
+    # Device names by combo index (same order as the device models)
+    _DEVICES = ("GPU", "CPU")
+
+    # Widget classes bound on the class (attribute lookups instead of module globals)
+    _VBox = QVBoxLayout
+    _Form = QFormLayout
+    _Combo = QComboBox
+    _Spin = QSpinBox
+    _Check = QCheckBox
+    _BBox = QDialogButtonBox
+
+    # Shared device models (built once): GPU+CPU selectable, or CPU only
+    _MODEL_BOTH: Optional[QStandardItemModel] = None
+    _MODEL_CPU_ONLY: Optional[QStandardItemModel] = None
+
+    _BIG_BRAIN_TOOLTIP = (
+        "Big Brain workers handle items that regular workers struggle with.\n"
+        "Items that hit 100+ attempts get passed to Big Brain workers."
+    )
 
     def __init__(self, parent=None, gpu_available: bool = True):
         super().__init__(parent)
         self.setWindowTitle("Add Worker")
         self.setMinimumWidth(300)
-
-        layout = QVBoxLayout(self)
+        self.big_brain_cb: Optional[QCheckBox] = None  # Built on first show
+        self._extras_built = False
+        self._cached_config: Optional[WorkerConfig] = None  # Captured on accept
+        self._last_config: Optional[WorkerConfig] = None  # Reused when values are unchanged
+        self._build_ui()
+        self.reset(gpu_available)
+
+    def _build_ui(self):
+        """Construct the dialog widgets (runs once per dialog instance)."""
+        # Freeze painting and layout so construction costs one layout pass
+        self.setUpdatesEnabled(False)
+        layout = self._VBox(self)
+        self._layout = layout
+        layout.setEnabled(False)
 
         # Form
-        form = QFormLayout()
+        form = self._Form()
 
-        self.device_combo = QComboBox()
-        self.device_combo.addItems(["GPU", "CPU"])
-        if not gpu_available:
-            self.device_combo.setCurrentIndex(1)  # Default to CPU
-            self.device_combo.model().item(0).setEnabled(False)
+        self.device_combo = self._Combo()
         form.addRow("Device:", self.device_combo)
 
-        self.neurons_spin = QSpinBox()
-        self.neurons_spin.setRange(50000, 2000000)
-        self.neurons_spin.setSingleStep(50000)
-        self.neurons_spin.setValue(200000)
+        self.neurons_spin = self._Spin()
+        with QSignalBlocker(self.neurons_spin):
+            self.neurons_spin.setRange(50000, 2000000)
+            self.neurons_spin.setSingleStep(50000)
         form.addRow("Neurons:", self.neurons_spin)
 
         layout.addLayout(form)
 
-        # Big Brain checkbox
-        self.big_brain_cb = QCheckBox("Big Brain (handles difficult items)")
-        self.big_brain_cb.setToolTip(
-            "Big Brain workers handle items that regular workers struggle with.\n"
-            "Items that hit 100+ attempts get passed to Big Brain workers."
-        )
-        layout.addWidget(self.big_brain_cb)
+        # Big Brain checkbox is inserted here by _ensure_extras()
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+        buttons = self._BBox(
+            self._BBox.Ok | self._BBox.Cancel
         )
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
-    def get_config(self) -> Tuple[str, int, bool]:
+        layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
+
+    def _ensure_extras(self):
+        """Build the secondary widgets (Big Brain checkbox) on first use."""
+        if self._extras_built:
+            return
+        self.big_brain_cb = self._Check("Big Brain (handles difficult items)")
+        self.big_brain_cb.setToolTip(self._BIG_BRAIN_TOOLTIP)
+        self._layout.insertWidget(1, self.big_brain_cb)  # Between form and buttons
+        self._extras_built = True
+
+    def showEvent(self, event):
+        """Materialize deferred widgets just before the first paint."""
+        self._ensure_extras()
+        super().showEvent(event)
+
+    @classmethod
+    def _init_device_models(cls):
+        """Build the two shared device models on first use."""
+        if cls._MODEL_BOTH is not None:
+            return
+        cls._MODEL_BOTH = QStandardItemModel()
+        cls._MODEL_CPU_ONLY = QStandardItemModel()
+        for model in (cls._MODEL_BOTH, cls._MODEL_CPU_ONLY):
+            for device in cls._DEVICES:
+                model.appendRow(QStandardItem(device))
+        cls._MODEL_CPU_ONLY.item(0).setEnabled(False)
+
+    def reset(self, gpu_available: bool = True):
+        """Restore default values for a fresh "Add Worker" prompt."""
+        self._cached_config = None
+        self._init_device_models()
+        model = self._MODEL_BOTH if gpu_available else self._MODEL_CPU_ONLY
+        # No handlers need intermediate values while defaults are applied
+        with QSignalBlocker(self.device_combo):
+            if self.device_combo.model() is not model:
+                self.device_combo.setModel(model)
+            self.device_combo.setCurrentIndex(0 if gpu_available else 1)  # Default to CPU without GPU
+        with QSignalBlocker(self.neurons_spin):
+            self.neurons_spin.setValue(200000)
+        if self._extras_built:
+            with QSignalBlocker(self.big_brain_cb):
+                self.big_brain_cb.setChecked(False)
+
+    @classmethod
+    def get_or_create(cls, parent=None, gpu_available: bool = True) -> "AddWorkerDialog":
+        """Get the shared dialog instance, reset to defaults for this invocation."""
+        dialog = cls._cached_dialog
+        if dialog is None or sip.isdeleted(dialog):
+            dialog = cls(parent, gpu_available=gpu_available)
+            cls._cached_dialog = dialog
+            return dialog
+        if dialog.parent() is not parent:
+            dialog.setParent(parent, dialog.windowFlags())
+        dialog.reset(gpu_available)
+        return dialog
+
+    def accept(self):
+        """Capture the chosen configuration once, then close."""
+        self._cached_config = self._read_config()
+        super().accept()
+
+    def get_config(self) -> WorkerConfig:
         """Get the worker configuration (device, neurons, is_big_brain)."""
-        return (self.device_combo.currentText(), self.neurons_spin.value(), self.big_brain_cb.isChecked())
+        if self._cached_config is not None:
+            return self._cached_config
+        return self._read_config()
+
+    def _read_config(self) -> WorkerConfig:
+        """Read the configuration from the widgets."""
+        is_big_brain = self.big_brain_cb.isChecked() if self._extras_built else False
+        config = WorkerConfig(self._DEVICES[self.device_combo.currentIndex()], self.neurons_spin.value(), is_big_brain)
+        if config == self._last_config:
+            return self._last_config
+        self._last_config = config
+        return config
+
+
+# =============================================================================
+# Widget Helpers
+# =============================================================================
+
+@contextmanager
+def _frozen(widget: QWidget):
+    """Suspend repaints of widget for a batch of updates (one repaint at the end)."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+# =============================================================================
+# Settings Persistence
+# =============================================================================
+
+def read_settings_file() -> Dict:
+    """Read and parse SETTINGS_FILE."""
+    return read_json(SETTINGS_FILE)
+
+
+def encode_settings(settings: Dict) -> bytes:
+    """Serialize settings to compact JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(settings)
+    return json.dumps(settings, separators=(",", ":")).encode('utf-8')
+
+
+def write_settings_file(payload: bytes):
+    """Atomically write encoded settings to SETTINGS_FILE (temp file + rename)."""
+    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(SETTINGS_FILE, payload)
+
+
+class _SaveSettingsJob(QRunnable):
+    """Writes the window's pending settings snapshots on a QThreadPool thread."""
+
+    def __init__(self, window: "JmemCreatorWindow"):
+        super().__init__()
+        self._window = window
+
+    def run(self):
+        self._window._write_pending_settings()
+
+
+class _ScanPacksJob(QRunnable):
+    """Runs a pack directory scan on a QThreadPool thread; results return by signal."""
+
+    def __init__(self, window: "JmemCreatorWindow", kind: str, generation: int, scan):
+        super().__init__()
+        self._window = window
+        self._kind = kind
+        self._generation = generation
+        self._scan = scan
+
+    def run(self):
+        try:
+            packs = self._scan()
+        except Exception as e:
+            self._window.pack_scan_failed.emit(self._kind, str(e))
+            packs = []
+        self._window.packs_scanned.emit(self._kind, self._generation, packs)
 
 
 # =============================================================================
@@ -1073,6 +1646,10 @@ class AddWorkerDialog(QDialog):
 class JmemCreatorWindow(QMainWindow):
     """Main GUI window."""
 
+    settings_save_failed = pyqtSignal(str)  # Emitted from the settings writer thread
+    packs_scanned = pyqtSignal(str, int, object)  # (kind, generation, packs) from scan jobs
+    pack_scan_failed = pyqtSignal(str, str)  # (kind, error) from scan jobs
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("JMEM Creator")
@@ -1083,17 +1660,53 @@ class JmemCreatorWindow(QMainWindow):
         self.brain_dir: Optional[Path] = None  # Path to brain directory
         self.jcur_packs = []
         self.available_jmems = []  # Available JMEMs for base selection
-        self.selected_base_jmems: List[str] = []  # Paths of selected base JMEMs
+        self._available_jmems_by_path: Dict[str, Dict] = {}  # str(path) -> available JMEM
+        self.selected_base_jmems: List[str] = []  # Paths of selected base JMEMs (ordered)
+        self._selected_base_set = set()  # Same paths, for O(1) membership tests
         self.worker_configs: List[Tuple[str, int, bool]] = []  # (device, neurons, is_big_brain)
         self.worker_presets: Dict[str, List] = {}  # Saved worker presets
+        self._last_worker_stats: Optional[list] = None  # Last per-worker stats applied to table
+
+        # Background settings writer - saves coalesce so the newest snapshot wins
+        self._settings_lock = threading.Lock()
+        self._pending_settings: Optional[Dict] = None
+        self._save_inflight = False
+        self._last_settings_payload: Optional[bytes] = None  # What SETTINGS_FILE holds
+        self.settings_save_failed.connect(lambda e: self._log(f"Failed to save settings: {e}"))
+
+        # Pack scans run on the thread pool; only the newest scan of each kind is applied
+        self._scan_generation = {'jcur': 0, 'jmem': 0}
+        self._jmem_scan_waiters: List = []  # Called once the pending JMEM scan is applied
+        self.packs_scanned.connect(self._on_packs_scanned)
+        self.pack_scan_failed.connect(lambda kind, e: self._log(f"Failed to scan {kind} packs: {e}"))
+        # GUI-only preferences (window geometry); SETTINGS_FILE is shared with the CLI
+        self._qsettings = QSettings("JiyouJmem", "Creator")
+        self._close_confirmed = False  # Set once the user agreed to stop training and exit
+
+        # Button enabled states: refreshes are coalesced and skipped when unchanged
+        self._button_update_pending = False
+        self._button_state: Optional[Tuple[bool, ...]] = None
 
         self._setup_ui()
+        self._gpu_available = _cuda_available()
         self._load_settings()  # Load saved settings including brain_dir
         self._refresh_preset_combo()
-        self._update_button_states()
+        self._apply_button_states()  # Immediately, so the first paint is correct
+
+        # Widgets and startup state live for the whole session: keep them out
+        # of future collections
+        gc.freeze()
+        # Collection thresholds are process-wide, so they are set here once rather
+        # than from a training thread. Training allocates many short-lived objects
+        # per item; gen0 runs rarely, and workers collect at their own safe points.
+        gc.set_threshold(100_000, 50, 50)
 
     def _setup_ui(self):
         """Set up the UI."""
+        # One font instance shared by the path label and log (needs the QApplication,
+        # so it can't be a class attribute)
+        mono_font = QFont("Monospace", 9)
+
         central = QWidget()
         self.setCentralWidget(central)
         layout = QVBoxLayout(central)
@@ -1105,7 +1718,7 @@ class JmemCreatorWindow(QMainWindow):
 
         brain_layout.addWidget(QLabel("Directory:"))
         self.brain_dir_label = QLabel("Not set")
-        self.brain_dir_label.setFont(QFont("Monospace", 9))
+        self.brain_dir_label.setFont(mono_font)
         self.brain_dir_label.setMinimumWidth(200)
         brain_layout.addWidget(self.brain_dir_label)
 
@@ -1166,6 +1779,12 @@ class JmemCreatorWindow(QMainWindow):
         self.pdf_path_edit = QLineEdit()
         self.pdf_path_edit.setPlaceholderText("Select a PDF or TXT file...")
         self.pdf_path_edit.textChanged.connect(self._on_pdf_path_changed)
+        # Probe the filesystem once typing pauses, not on every keystroke
+        self._pending_pdf_text = ""
+        self._pdf_debounce = QTimer(self)
+        self._pdf_debounce.setSingleShot(True)
+        self._pdf_debounce.setInterval(300)
+        self._pdf_debounce.timeout.connect(self._do_pdf_path_probe)
         pdf_layout.addWidget(self.pdf_path_edit)
 
         self.pdf_browse_btn = QPushButton("Browse...")
@@ -1181,10 +1800,14 @@ class JmemCreatorWindow(QMainWindow):
         base_jmems_layout = QVBoxLayout(base_jmems_group)
 
         # List of selected base JMEMs
-        self.base_jmems_list = QListWidget()
-        self.base_jmems_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.base_jmems_list.setMaximumHeight(80)
-        base_jmems_layout.addWidget(self.base_jmems_list)
+        # (built on first add by _ensure_base_jmems_ui; an empty frame stands in)
+        self.base_jmems_list: Optional[QListWidget] = None
+        self._base_jmems_stack = QStackedWidget()
+        self._base_jmems_stack.setMaximumHeight(80)
+        base_jmems_placeholder = QFrame()
+        base_jmems_placeholder.setFrameShape(QFrame.StyledPanel)
+        self._base_jmems_stack.addWidget(base_jmems_placeholder)
+        base_jmems_layout.addWidget(self._base_jmems_stack)
 
         # Buttons
         base_btns_layout = QHBoxLayout()
@@ -1214,6 +1837,8 @@ class JmemCreatorWindow(QMainWindow):
         jmem_layout.addWidget(QLabel("JMEM:"))
         self.jmem_path_edit = QLineEdit()
         self.jmem_path_edit.setReadOnly(True)
+        self._jmem_path_cache: Optional[Path] = None  # Parsed jmem_path_edit text
+        self.jmem_path_edit.textChanged.connect(self._on_jmem_path_text_changed)
         jmem_layout.addWidget(self.jmem_path_edit)
 
         self.browse_btn = QPushButton("Browse")
@@ -1231,11 +1856,11 @@ class JmemCreatorWindow(QMainWindow):
         worker_layout = QVBoxLayout(worker_group)
 
         # Worker table
-        self.worker_table = QTableWidget()
-        self.worker_table.setColumnCount(6)
-        self.worker_table.setHorizontalHeaderLabels(["Device", "Neurons", "Type", "Status", "Current Item", "Attempts"])
-        self.worker_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.worker_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.worker_model = WorkerTableModel(self)
+        self.worker_table = QTableView()
+        self.worker_table.setModel(self.worker_model)
+        self.worker_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.worker_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.worker_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.worker_table.setMinimumHeight(200)
         self.worker_table.setMaximumHeight(300)
@@ -1305,7 +1930,14 @@ class JmemCreatorWindow(QMainWindow):
         # Elapsed time timer (memory-safe: single instance, reused)
         self._elapsed_timer = QTimer(self)
         self._elapsed_timer.timeout.connect(self._update_elapsed_time)
-        self._training_start_time: Optional[float] = None
+        self._elapsed_clock = QElapsedTimer()  # Invalid until training starts
+        self._last_elapsed_s = -1  # Last whole second shown in elapsed_label
+
+        # Progress poll timer - reads the worker's ProgressState snapshot
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)  # 10 Hz
+        self._progress_timer.timeout.connect(self._poll_progress)
+        self._last_progress: Optional[Tuple] = None
 
         layout.addWidget(progress_group)
 
@@ -1343,10 +1975,21 @@ class JmemCreatorWindow(QMainWindow):
 
         self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setFont(QFont("Monospace", 9))
+        self.log_text.setFont(mono_font)
         self.log_text.setMaximumBlockCount(1000)  # Limit lines
+        self.log_text.setUndoRedoEnabled(False)  # Read-only log, no undo stack
+        self.log_text.setCenterOnScroll(False)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)  # Avoid re-flowing on append
         log_layout.addWidget(self.log_text)
 
+        # (epoch second, message) pairs queued by _log and appended in batches by _flush_log
+        # (single-shot, armed by the first queued line: no wakeups while idle)
+        self._log_queue = collections.deque(maxlen=2000)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
         layout.addWidget(log_group, 1)  # stretch=1 to fill remaining vertical space
 
     def _on_select_brain_dir(self):
@@ -1387,34 +2030,22 @@ class JmemCreatorWindow(QMainWindow):
         """Load saved settings from disk."""
         if SETTINGS_FILE.exists():
             try:
-                settings = json.loads(SETTINGS_FILE.read_text())
+                settings = read_settings_file()
+                self._last_settings_payload = encode_settings(settings)
 
                 # Restore brain directory
                 if 'brain_dir' in settings:
                     path = Path(settings['brain_dir'])
                     if path.exists() and (path / "api.py").exists():
-                        if load_brain_modules(path):
-                            self.brain_dir = path
-                            self.brain_dir_label.setText(path.name)
-                            self._log(f"Brain loaded: {path.name}")
-                            self._refresh_jcur_list()
-                            self._refresh_available_jmems()
+                        if path == get_brain_dir():
+                            self._restore_brain_dir(path)
+                        else:
+                            # Import after __init__ returns so the window paints first
+                            QTimer.singleShot(0, lambda: self._restore_brain_dir(path))
 
                 # Restore worker configurations
                 if 'worker_configs' in settings:
-                    gpu_available = torch.cuda.is_available()
-                    for config in settings['worker_configs']:
-                        # Handle both old 2-tuple and new 3-tuple format
-                        if len(config) == 2:
-                            device, neurons = config
-                            is_big_brain = False
-                        else:
-                            device, neurons, is_big_brain = config
-                        # Skip GPU workers if GPU not available
-                        if device == 'GPU' and not gpu_available:
-                            continue
-                        self.worker_configs.append((device, neurons, is_big_brain))
-                    self._update_worker_table()
+                    self._set_worker_configs(settings['worker_configs'])
                     self._log(f"Restored {len(self.worker_configs)} worker configurations")
 
                 # Restore worker presets
@@ -1422,8 +2053,9 @@ class JmemCreatorWindow(QMainWindow):
                     self.worker_presets = settings['worker_presets']
                     self._log(f"Loaded {len(self.worker_presets)} worker presets")
 
-                # Restore window geometry
-                if all(k in settings for k in ['window_x', 'window_y', 'window_width', 'window_height']):
+                # Legacy window geometry (now kept in QSettings)
+                if (self._qsettings.value("geometry") is None
+                        and all(k in settings for k in ['window_x', 'window_y', 'window_width', 'window_height'])):
                     self.setGeometry(
                         settings['window_x'],
                         settings['window_y'],
@@ -1434,36 +2066,93 @@ class JmemCreatorWindow(QMainWindow):
             except Exception as e:
                 self._log(f"Failed to load settings: {e}")
 
+        # Restore window geometry
+        geometry = self._qsettings.value("geometry")
+        if geometry is not None:
+            self.restoreGeometry(geometry)
+
+    def _restore_brain_dir(self, path: Path):
+        """Load the brain directory restored from settings."""
+        if load_brain_modules(path):
+            self.brain_dir = path
+            self.brain_dir_label.setText(path.name)
+            self._log(f"Brain loaded: {path.name}")
+            self._refresh_jcur_list()
+            self._refresh_available_jmems()
+            self._update_button_states()
+
     def _save_settings(self):
-        """Save settings to disk."""
-        try:
-            SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            # Save window geometry
-            geo = self.geometry()
-            settings = {
-                'worker_configs': self.worker_configs,
-                'worker_presets': self.worker_presets,
-                'window_x': geo.x(),
-                'window_y': geo.y(),
-                'window_width': geo.width(),
-                'window_height': geo.height(),
-            }
-            if self.brain_dir:
-                settings['brain_dir'] = str(self.brain_dir)
-            SETTINGS_FILE.write_text(json.dumps(settings, indent=2))
-        except Exception as e:
-            self._log(f"Failed to save settings: {e}")
+        """Save settings to disk (serialized and written on a background thread)."""
+        # Window geometry is GUI-only: QSettings stores it incrementally
+        self._qsettings.setValue("geometry", self.saveGeometry())
+
+        # Snapshot on the UI thread; copies keep the writer off live state
+        settings = {
+            'worker_configs': list(self.worker_configs),
+            'worker_presets': {name: list(cfgs) for name, cfgs in self.worker_presets.items()},
+        }
+        if self.brain_dir:
+            settings['brain_dir'] = str(self.brain_dir)
+
+        with self._settings_lock:
+            self._pending_settings = settings
+            if self._save_inflight:
+                return  # Running writer picks up the newer snapshot
+            self._save_inflight = True
+        QThreadPool.globalInstance().start(_SaveSettingsJob(self))
+
+    def _write_pending_settings(self):
+        """Write pending settings until none remain (runs on a pool thread)."""
+        while True:
+            with self._settings_lock:
+                settings = self._pending_settings
+                self._pending_settings = None
+                if settings is None:
+                    self._save_inflight = False
+                    return
+            try:
+                payload = encode_settings(settings)
+                if payload == self._last_settings_payload:
+                    continue  # Unchanged: skip the write + fsync
+                write_settings_file(payload)
+                self._last_settings_payload = payload
+            except Exception as e:
+                self.settings_save_failed.emit(str(e))
+
+    def _start_pack_scan(self, kind: str, scan):
+        """Run a pack scan off the GUI thread (slow disks/network mounts can't freeze the UI)."""
+        self._scan_generation[kind] += 1
+        QThreadPool.globalInstance().start(
+            _ScanPacksJob(self, kind, self._scan_generation[kind], scan)
+        )
+
+    def _on_packs_scanned(self, kind: str, generation: int, packs: list):
+        """Apply a finished pack scan unless a newer one of the same kind was started."""
+        if generation != self._scan_generation[kind]:
+            return
+        if kind == 'jcur':
+            self._apply_jcur_packs(packs)
+        else:
+            self._apply_available_jmems(packs)
+            waiters, self._jmem_scan_waiters = self._jmem_scan_waiters, []
+            for then in waiters:
+                then()
 
     def _refresh_jcur_list(self):
-        """Refresh the JCUR dropdown from local curricula directory."""
-        self.jcur_packs = find_jcur_packs()
-        self.jcur_combo.clear()
-
-        for pack in self.jcur_packs:
-            self.jcur_combo.addItem(
-                f"{pack['name']} ({pack['total_items']} items)",
-                pack
-            )
+        """Refresh the JCUR dropdown from local curricula directory (scanned in background)."""
+        self._start_pack_scan('jcur', find_jcur_packs)
+
+    def _apply_jcur_packs(self, packs: List[Dict]):
+        """Populate the JCUR dropdown with scanned packs."""
+        self.jcur_packs = packs
+        labels = [f"{pack['name']} ({pack['total_items']} items)" for pack in self.jcur_packs]
+
+        # Populate silently in one insert, then sync the selection once.
+        # Packs are looked up by index in self.jcur_packs, so no item data is attached.
+        with QSignalBlocker(self.jcur_combo):
+            self.jcur_combo.clear()
+            self.jcur_combo.addItems(labels)
+        self._on_jcur_changed(self.jcur_combo.currentIndex())
 
         self._log(f"Found {len(self.jcur_packs)} JCUR packs in {CURRICULA_DIR}")
 
@@ -1488,8 +2177,9 @@ class JmemCreatorWindow(QMainWindow):
         """Handle source type selection change."""
         self.source_stack.setCurrentIndex(index)
 
-        # Clear JMEM path when switching to book mode
-        if index == 1:  # PDF/TXT Book
+        # Clear JMEM path when switching to book mode. Not signal-blocked: textChanged
+        # keeps _jmem_path_cache in sync, so only clear when there is something to clear.
+        if index == 1 and self.jmem_path_edit.text():  # PDF/TXT Book
             self.jmem_path_edit.clear()
 
     def _on_browse_pdf(self):
@@ -1502,9 +2192,18 @@ class JmemCreatorWindow(QMainWindow):
         )
         if path:
             self.pdf_path_edit.setText(path)
+            # Picked from a dialog: no need to wait out the debounce
+            self._pdf_debounce.stop()
+            self._do_pdf_path_probe()
 
     def _on_pdf_path_changed(self, text: str):
-        """Handle PDF path change."""
+        """Handle PDF path change (debounced)."""
+        self._pending_pdf_text = text
+        self._pdf_debounce.start()
+
+    def _do_pdf_path_probe(self):
+        """Derive the JMEM output path from the settled PDF path."""
+        text = self._pending_pdf_text
         if not text:
             return
         if self.brain_dir is None:
@@ -1533,10 +2232,14 @@ class JmemCreatorWindow(QMainWindow):
         if path:
             self.jmem_path_edit.setText(path)
 
+    def _on_jmem_path_text_changed(self, text: str):
+        """Re-parse the output path only when its text changes."""
+        self._jmem_path_cache = Path(text) if text else None
+
     def _on_clear_jmem(self):
         """Clear the JMEM directory."""
-        jmem_path = Path(self.jmem_path_edit.text())
-        if not jmem_path.exists():
+        jmem_path = self._jmem_path_cache
+        if jmem_path is None or not jmem_path.exists():
             self._log("JMEM path doesn't exist")
             return
 
@@ -1548,8 +2251,7 @@ class JmemCreatorWindow(QMainWindow):
 
         if reply == QMessageBox.Yes:
             try:
-                shutil.rmtree(jmem_path)
-                jmem_path.mkdir(parents=True)
+                clear_directory(jmem_path)
                 self._log(f"Cleared: {jmem_path}")
             except Exception as e:
                 self._log(f"Error clearing: {e}")
@@ -1558,11 +2260,10 @@ class JmemCreatorWindow(QMainWindow):
 
     def _on_add_worker(self):
         """Open dialog to add a new worker."""
-        gpu_available = torch.cuda.is_available()
-        dialog = AddWorkerDialog(self, gpu_available=gpu_available)
+        dialog = AddWorkerDialog.get_or_create(self, gpu_available=self._gpu_available)
         if dialog.exec_() == QDialog.Accepted:
-            device, neurons, is_big_brain = dialog.get_config()
-            self._add_worker_to_table(device, neurons, is_big_brain)
+            config = dialog.get_config()
+            self._add_worker_to_table(config.device, config.neurons, config.is_big_brain)
 
     def _add_worker_to_table(self, device: str, neurons: int, is_big_brain: bool = False):
         """Add a worker configuration to the table."""
@@ -1571,7 +2272,7 @@ class JmemCreatorWindow(QMainWindow):
 
     def _on_remove_worker(self):
         """Remove selected worker from table."""
-        row = self.worker_table.currentRow()
+        row = self.worker_table.currentIndex().row()
         if row >= 0 and row < len(self.worker_configs):
             self.worker_configs.pop(row)
             self._update_worker_table()
@@ -1581,6 +2282,23 @@ class JmemCreatorWindow(QMainWindow):
         self.worker_configs.clear()
         self._update_worker_table()
 
+    def _set_worker_configs(self, configs: List) -> int:
+        """
+        Replace the worker list with saved (device, neurons[, is_big_brain]) configs.
+
+        GPU workers are dropped when no GPU is available.
+
+        Returns:
+            Number of configs skipped
+        """
+        # Handle both old 2-tuple and new 3-tuple format
+        rows = [(c[0], c[1], c[2] if len(c) > 2 else False) for c in configs]
+        if not self._gpu_available:
+            rows = [row for row in rows if row[0] != 'GPU']
+        self.worker_configs = rows
+        self._update_worker_table()
+        return len(configs) - len(rows)
+
     def _on_save_preset(self):
         """Save current worker configuration as a preset."""
         if not self.worker_configs:
@@ -1590,8 +2308,6 @@ class JmemCreatorWindow(QMainWindow):
         name, ok = QInputDialog.getText(self, "Save Preset", "Preset name:")
         if ok and name.strip():
             name = name.strip()
-            if not hasattr(self, 'worker_presets'):
-                self.worker_presets = {}
             self.worker_presets[name] = list(self.worker_configs)
             self._refresh_preset_combo()
             self._save_settings()
@@ -1600,20 +2316,10 @@ class JmemCreatorWindow(QMainWindow):
     def _on_load_preset(self):
         """Load selected preset."""
         name = self.preset_combo.currentText()
-        if not name or not hasattr(self, 'worker_presets') or name not in self.worker_presets:
+        if not name or name not in self.worker_presets:
             return
 
-        gpu_available = torch.cuda.is_available()
-        self.worker_configs = []
-        skipped = 0
-        for config in self.worker_presets[name]:
-            device, neurons, is_big_brain = config
-            if device == 'GPU' and not gpu_available:
-                skipped += 1
-                continue
-            self.worker_configs.append((device, neurons, is_big_brain))
-
-        self._update_worker_table()
+        skipped = self._set_worker_configs(self.worker_presets[name])
         msg = f"Loaded preset: {name} ({len(self.worker_configs)} workers)"
         if skipped:
             msg += f" - skipped {skipped} GPU workers (no GPU)"
@@ -1622,7 +2328,7 @@ class JmemCreatorWindow(QMainWindow):
     def _on_delete_preset(self):
         """Delete selected preset."""
         name = self.preset_combo.currentText()
-        if not name or not hasattr(self, 'worker_presets') or name not in self.worker_presets:
+        if not name or name not in self.worker_presets:
             return
 
         reply = QMessageBox.question(
@@ -1638,56 +2344,44 @@ class JmemCreatorWindow(QMainWindow):
 
     def _refresh_preset_combo(self):
         """Refresh the preset dropdown."""
-        self.preset_combo.clear()
-        if hasattr(self, 'worker_presets'):
-            for name in sorted(self.worker_presets.keys()):
-                self.preset_combo.addItem(name)
+        with QSignalBlocker(self.preset_combo):
+            self.preset_combo.clear()
+            self.preset_combo.addItems(sorted(self.worker_presets))
 
     def _update_worker_table(self):
         """Update the worker table display."""
-        self.worker_table.setRowCount(len(self.worker_configs))
-        for i, (device, neurons, is_big_brain) in enumerate(self.worker_configs):
-            self.worker_table.setItem(i, 0, QTableWidgetItem(device))
-            self.worker_table.setItem(i, 1, QTableWidgetItem(f"{neurons:,}"))
-            worker_type = "Big Brain" if is_big_brain else "Normal"
-            self.worker_table.setItem(i, 2, QTableWidgetItem(worker_type))
-            self.worker_table.setItem(i, 3, QTableWidgetItem("Ready"))
-            self.worker_table.setItem(i, 4, QTableWidgetItem(""))  # Current item
-            self.worker_table.setItem(i, 5, QTableWidgetItem(""))  # Attempts
+        self.worker_model.set_configs(self.worker_configs)
+        self._last_worker_stats = None
         self._update_button_states()
 
     def _on_worker_stats(self, per_worker: list):
         """Update per-worker status in table during training."""
+        # Pool ticks often repeat identical stats; skip formatting entirely then
+        if per_worker == self._last_worker_stats:
+            return
+        self._last_worker_stats = per_worker
+
+        model = self.worker_model
+        row_count = model.rowCount()
         for i, stats in enumerate(per_worker):
-            if i < self.worker_table.rowCount():
+            if i < row_count:
                 accuracy = stats.get('accuracy', 0) * 100
                 total = stats.get('total', 0)
                 is_big = stats.get('is_big_brain', False)
                 prefix = "BB: " if is_big else ""
                 status = f"{prefix}{total} items, {accuracy:.0f}%"
+                model.update_status(i, status)
 
-                # Update Status column (3)
-                item = self.worker_table.item(i, 3)
-                if item:
-                    item.setText(status)
-                else:
-                    self.worker_table.setItem(i, 3, QTableWidgetItem(status))
-
-                # Update Current Item column (4)
+                # Current Item column
                 current_target = stats.get('current_target', '')
                 if current_target:
                     # Truncate long targets for display
                     display_text = current_target[:40] + "..." if len(current_target) > 40 else current_target
                 else:
                     display_text = "(idle)"
+                model.set_cell(i, WorkerTableModel.COL_CURRENT_ITEM, display_text)
 
-                item = self.worker_table.item(i, 4)
-                if item:
-                    item.setText(display_text)
-                else:
-                    self.worker_table.setItem(i, 4, QTableWidgetItem(display_text))
-
-                # Update Attempts column (5)
+                # Attempts column
                 current_attempts = stats.get('current_attempts', 0)
                 global_attempts = stats.get('current_global_attempts', 0)
                 if current_attempts > 0:
@@ -1695,16 +2389,14 @@ class JmemCreatorWindow(QMainWindow):
                     attempts_text = f"{current_attempts}/{global_attempts}"
                 else:
                     attempts_text = ""
-
-                item = self.worker_table.item(i, 5)
-                if item:
-                    item.setText(attempts_text)
-                else:
-                    self.worker_table.setItem(i, 5, QTableWidgetItem(attempts_text))
+                model.set_cell(i, WorkerTableModel.COL_ATTEMPTS, attempts_text)
 
     def _on_start_fresh(self):
         """Start fresh - clear JMEM and progress."""
-        jmem_path = Path(self.jmem_path_edit.text())
+        jmem_path = self._jmem_path_cache
+        if jmem_path is None:
+            self._log("No output path specified")
+            return
 
         reply = QMessageBox.question(
             self, "Start Fresh",
@@ -1715,8 +2407,9 @@ class JmemCreatorWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             try:
                 if jmem_path.exists():
-                    shutil.rmtree(jmem_path)
-                jmem_path.mkdir(parents=True)
+                    clear_directory(jmem_path)
+                else:
+                    jmem_path.mkdir(parents=True)
                 self._log("Cleared all data. Ready for fresh start.")
                 self.progress_bar.setValue(0)
                 self.lesson_label.setText("Lesson: -")
@@ -1725,20 +2418,32 @@ class JmemCreatorWindow(QMainWindow):
             except Exception as e:
                 self._log(f"Error: {e}")
 
-    def _refresh_available_jmems(self):
-        """Refresh the list of available JMEMs for base selection."""
-        self.available_jmems = find_jmem_packs(self.brain_dir)
+    def _refresh_available_jmems(self, then=None):
+        """
+        Refresh the list of available JMEMs for base selection (scanned in background).
+
+        Args:
+            then: Optional callable run once the refreshed list has been applied
+        """
+        if then is not None:
+            self._jmem_scan_waiters.append(then)
+        self._start_pack_scan('jmem', partial(find_jmem_packs, self.brain_dir))
+
+    def _apply_available_jmems(self, packs: List[Dict]):
+        """Store scanned JMEM packs for base selection."""
+        self.available_jmems = packs
+        self._available_jmems_by_path = {str(j['path']): j for j in self.available_jmems}
         self._log(f"Found {len(self.available_jmems)} available JMEM pack(s)")
 
     def _on_add_base_jmem(self):
         """Add a base JMEM from available packs or browse."""
         # Get current output path to exclude it
-        current_output = Path(self.jmem_path_edit.text()).name if self.jmem_path_edit.text() else None
+        current_output = self._jmem_path_cache.name if self._jmem_path_cache else None
 
         # Filter out already selected and current output
         available = [
-            j for j in self.available_jmems
-            if str(j['path']) not in self.selected_base_jmems
+            j for p, j in self._available_jmems_by_path.items()
+            if p not in self._selected_base_set
             and j['path'].name != current_output
         ]
 
@@ -1749,12 +2454,11 @@ class JmemCreatorWindow(QMainWindow):
                 self, "Select Base JMEM Directory",
                 start_dir
             )
-            if path and path not in self.selected_base_jmems:
+            if path and path not in self._selected_base_set:
                 self._add_base_jmem_path(path)
             return
 
         # Show quick selection dialog with available packs
-        from PyQt5.QtWidgets import QInputDialog
         names = [f"{j['name']} ({j['total_memories']} memories)" for j in available]
         name, ok = QInputDialog.getItem(
             self, "Add Base JMEM",
@@ -1765,44 +2469,80 @@ class JmemCreatorWindow(QMainWindow):
             idx = names.index(name)
             self._add_base_jmem_path(str(available[idx]['path']))
 
-    def _add_base_jmem_path(self, path: str):
-        """Add a base JMEM path to the list."""
-        if path in self.selected_base_jmems:
+    def _ensure_base_jmems_ui(self) -> QListWidget:
+        """Build the base JMEMs list widget on first use and swap it in."""
+        if self.base_jmems_list is None:
+            self.base_jmems_list = QListWidget()
+            self.base_jmems_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+            self.base_jmems_list.setEnabled(self.add_base_btn.isEnabled())
+            self._base_jmems_stack.addWidget(self.base_jmems_list)
+            self._base_jmems_stack.setCurrentWidget(self.base_jmems_list)
+        return self.base_jmems_list
+
+    def _add_base_jmem_path(self, path: str, quiet: bool = False):
+        """Add a base JMEM path to the list (quiet=True skips the per-path log line)."""
+        if path in self._selected_base_set:
             return
+        self._ensure_base_jmems_ui()
         self.selected_base_jmems.append(path)
+        self._selected_base_set.add(path)
         # Display name with memory count
-        name = Path(path).name
-        for j in self.available_jmems:
-            if str(j['path']) == path:
-                name = f"{j['name']} ({j['total_memories']} memories)"
-                break
-        item = self.base_jmems_list.addItem(name)
-        self.base_jmems_list.item(self.base_jmems_list.count() - 1).setData(Qt.UserRole, path)
-        self._log(f"Added base JMEM: {Path(path).name}")
+        j = self._available_jmems_by_path.get(path)
+        name = f"{j['name']} ({j['total_memories']} memories)" if j else Path(path).name
+        # Attach the path before inserting: one insert, no follow-up dataChanged
+        item = QListWidgetItem(name)
+        item.setData(Qt.UserRole, path)
+        self.base_jmems_list.addItem(item)
+        if not quiet:
+            self._log(f"Added base JMEM: {Path(path).name}")
 
     def _on_remove_base_jmem(self):
         """Remove selected base JMEMs."""
-        for item in self.base_jmems_list.selectedItems():
-            path = item.data(Qt.UserRole)
-            if path in self.selected_base_jmems:
-                self.selected_base_jmems.remove(path)
-            self.base_jmems_list.takeItem(self.base_jmems_list.row(item))
+        if self.base_jmems_list is None:
+            return  # Nothing added yet
+        removed = set()
+        with _frozen(self.base_jmems_list):
+            for item in self.base_jmems_list.selectedItems():
+                removed.add(item.data(Qt.UserRole))
+                self.base_jmems_list.takeItem(self.base_jmems_list.row(item))
+        removed &= self._selected_base_set
+        if removed:
+            # One ordered rebuild instead of an O(N) list.remove per path
+            self._selected_base_set -= removed
+            self.selected_base_jmems = [p for p in self.selected_base_jmems if p not in removed]
 
     def _on_auto_add_base_jmems(self):
         """Auto-add all available JMEMs except the current output."""
-        self._refresh_available_jmems()
-        current_output = Path(self.jmem_path_edit.text()).name if self.jmem_path_edit.text() else None
+        self._refresh_available_jmems(then=self._auto_add_base_jmems)
 
-        added = 0
+    def _auto_add_base_jmems(self):
+        """Add every freshly scanned JMEM that isn't selected or the current output."""
+        current_output = self._jmem_path_cache.name if self._jmem_path_cache else None
+
+        new_paths = []
+        new_names = []
         for jmem in self.available_jmems:
             path = str(jmem['path'])
             # Skip if already added or is the current output
-            if path in self.selected_base_jmems:
+            if path in self._selected_base_set:
                 continue
             if jmem['path'].name == current_output:
                 continue
-            self._add_base_jmem_path(path)
-            added += 1
+            new_paths.append(path)
+            new_names.append(f"{jmem['name']} ({jmem['total_memories']} memories)")
+        added = len(new_paths)
+
+        if new_paths:
+            self.selected_base_jmems.extend(new_paths)
+            self._selected_base_set.update(new_paths)
+
+            # One bulk insert, with repaints frozen while item data is attached
+            base_list = self._ensure_base_jmems_ui()
+            start = base_list.count()
+            with _frozen(base_list):
+                base_list.addItems(new_names)
+                for i, path in enumerate(new_paths):
+                    base_list.item(start + i).setData(Qt.UserRole, path)
 
         if added > 0:
             self._log(f"Auto-added {added} base JMEM(s)")
@@ -1836,8 +2576,8 @@ class JmemCreatorWindow(QMainWindow):
             )
             return
 
-        jmem_path = Path(self.jmem_path_edit.text())
-        if not jmem_path:
+        jmem_path = self._jmem_path_cache
+        if jmem_path is None:
             self._log("No output path specified")
             return
 
@@ -1872,29 +2612,31 @@ class JmemCreatorWindow(QMainWindow):
 
         # Create and start pool worker
         self.worker = PoolTrainingWorker(
-            worker_configs=self.worker_configs.copy(),
+            worker_configs=tuple(self.worker_configs),
             jcur_path=jcur_path,
             jmem_path=jmem_path,
-            base_jmems=self.selected_base_jmems.copy(),
+            base_jmems=tuple(self.selected_base_jmems),
             skip_trained=skip_trained,
         )
 
         # Connect signals
-        self.worker.log_message.connect(self._log)
-        self.worker.progress_update.connect(self._on_progress_update)
-        self.worker.stats_update.connect(self._on_stats_update)
-        self.worker.worker_stats.connect(self._on_worker_stats)
-        self.worker.training_finished.connect(self._on_training_finished)
-        self.worker.training_error.connect(self._on_training_error)
+        # Queued: slots always run on the GUI thread, whichever thread emits
+        self.worker.log_message.connect(self._log, Qt.QueuedConnection)
+        self.worker.worker_stats.connect(self._on_worker_stats, Qt.QueuedConnection)
+        self.worker.training_finished.connect(self._on_training_finished, Qt.QueuedConnection)
+        self.worker.training_error.connect(self._on_training_error, Qt.QueuedConnection)
 
         # Update worker status to "Initializing" (columns 3-5)
-        for i in range(self.worker_table.rowCount()):
-            self.worker_table.setItem(i, 3, QTableWidgetItem("Initializing..."))
-            self.worker_table.setItem(i, 4, QTableWidgetItem(""))
-            self.worker_table.setItem(i, 5, QTableWidgetItem(""))
+        with _frozen(self.worker_table):
+            self.worker_model.fill_column(WorkerTableModel.COL_STATUS, "Initializing...")
+            self.worker_model.fill_column(WorkerTableModel.COL_CURRENT_ITEM, "")
+            self.worker_model.fill_column(WorkerTableModel.COL_ATTEMPTS, "")
+        self._last_worker_stats = None
 
         self.worker.start()
         self._start_elapsed_timer()
+        self._last_progress = None
+        self._progress_timer.start()
         self._update_button_states()
         self._log("Training started...")
 
@@ -1924,8 +2666,8 @@ class JmemCreatorWindow(QMainWindow):
             self.worker.stop()
 
             # Update manifest when stopped early
-            jmem_path = Path(self.jmem_path_edit.text())
-            if jmem_path.exists():
+            jmem_path = self._jmem_path_cache
+            if jmem_path is not None and jmem_path.exists():
                 jcur_name = self.jcur_combo.currentText() if self.jcur_combo.currentIndex() >= 0 else None
                 manifest = create_or_update_manifest(
                     jmem_path, jcur_name,
@@ -1941,25 +2683,28 @@ class JmemCreatorWindow(QMainWindow):
         """
         # Confirm with user
         if self.worker and self.worker.isRunning():
-            reply = QMessageBox.question(
-                self, "Restart Training (Recalibration)",
+            self._confirm(
+                "Restart Training (Recalibration)",
                 "This will stop current training and restart from item 1.\n\n"
                 "• All items will be trained (no skipping)\n"
                 "• Fresh brains will calibrate on existing memories\n"
                 "• JMEM progress is preserved\n\n"
                 "Continue?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
+                self._restart_training,
             )
-            if reply != QMessageBox.Yes:
-                return
+            return
+        self._restart_training()
 
+    def _restart_training(self):
+        """Stop any running training and start again in recalibration mode."""
+        if self.worker and self.worker.isRunning():
             # Stop current training
             self._log("Restarting training (recalibration mode)...")
             self._stop_elapsed_timer()
+            self._progress_timer.stop()
             self.worker.stop()
             self.worker.wait(5000)  # Wait up to 5 seconds for stop
-            self.worker = None
+            self._teardown_worker()
 
         # Reset progress display
         self.progress_bar.setValue(0)
@@ -1969,12 +2714,26 @@ class JmemCreatorWindow(QMainWindow):
         self.lesson_label.setText("Lesson: -")
 
         # Reset worker table status (column 3 is Status)
-        for i in range(self.worker_table.rowCount()):
-            self.worker_table.setItem(i, 3, QTableWidgetItem("Ready"))
+        self.worker_model.fill_column(WorkerTableModel.COL_STATUS, "Ready")
 
         # Start from item 1 (recalibration mode - no skipping)
         self._on_start(skip_trained=False)
 
+    def _poll_progress(self):
+        """Apply the worker's latest progress snapshot to the UI."""
+        if self.worker is None:
+            return
+        snapshot = self.worker.progress.snapshot()
+        if snapshot is None or snapshot == self._last_progress:
+            return
+        last = self._last_progress
+        self._last_progress = snapshot
+        # Only repaint the widgets whose part of the snapshot changed
+        if last is None or snapshot[:3] != last[:3]:
+            self._on_progress_update(*snapshot[:3])
+        if last is None or snapshot[3:] != last[3:]:
+            self._on_stats_update(*snapshot[3:])
+
     def _on_progress_update(self, current: int, total: int, lesson_name: str):
         """Handle progress update."""
         self.progress_bar.setMaximum(total)
@@ -1989,53 +2748,80 @@ class JmemCreatorWindow(QMainWindow):
 
     def _update_elapsed_time(self):
         """Update elapsed time display."""
-        if self._training_start_time is None:
+        if not self._elapsed_clock.isValid():
             return
-        elapsed = time.time() - self._training_start_time
-        hours = int(elapsed // 3600)
-        minutes = int((elapsed % 3600) // 60)
-        seconds = int(elapsed % 60)
+        elapsed_s = self._elapsed_clock.elapsed() // 1000
+        if elapsed_s == self._last_elapsed_s:
+            return  # Same second, skip the repaint
+        self._last_elapsed_s = elapsed_s
+        hours, rem = divmod(elapsed_s, 3600)
+        minutes, seconds = divmod(rem, 60)
         self.elapsed_label.setText(f"Time: {hours:02d}:{minutes:02d}:{seconds:02d}")
 
     def _start_elapsed_timer(self):
         """Start the elapsed time timer."""
-        self._training_start_time = time.time()
+        self._elapsed_clock.start()
+        self._last_elapsed_s = -1
         self._elapsed_timer.start(1000)  # Update every second
 
     def _stop_elapsed_timer(self):
         """Stop the elapsed time timer."""
         self._elapsed_timer.stop()
 
+    def _teardown_worker(self):
+        """Disconnect and release the finished worker and the brain it used."""
+        if self.worker is None:
+            return
+
+        # Disconnect worker signals to prevent memory leak
+        try:
+            self.worker.log_message.disconnect(self._log)
+            self.worker.training_finished.disconnect(self._on_training_finished)
+            self.worker.training_error.disconnect(self._on_training_error)
+            # PoolTrainingWorker has worker_stats signal
+            if hasattr(self.worker, 'worker_stats'):
+                self.worker.worker_stats.disconnect(self._on_worker_stats)
+        except TypeError:
+            pass  # Already disconnected
+
+        # Clean up worker and brain to prevent memory leak
+        try:
+            if JiyouBrain is not None:
+                JiyouBrain.clear_instance()
+        except Exception:
+            pass
+
+        flush_log_buffer()  # Don't lose buffered trials on shutdown
+        self.worker.deleteLater()
+        self.worker = None
+        # The worker held the pool/brain; reclaim any cycles it leaves behind
+        gc.collect()
+
+    def _is_stale_signal(self) -> bool:
+        """True if the calling signal came from a worker that was already replaced."""
+        sender = self.sender()
+        return sender is not None and sender is not self.worker
+
     def _on_training_finished(self):
         """Handle training finished."""
+        if self._is_stale_signal():
+            return
         self._stop_elapsed_timer()
+        self._poll_progress()  # Land on the final state
+        self._progress_timer.stop()
         self._log("Training finished.")
-
-        # Disconnect worker signals to prevent memory leak
-        if self.worker:
-            try:
-                self.worker.log_message.disconnect(self._log)
-                self.worker.progress_update.disconnect(self._on_progress_update)
-                self.worker.stats_update.disconnect(self._on_stats_update)
-                self.worker.training_finished.disconnect(self._on_training_finished)
-                self.worker.training_error.disconnect(self._on_training_error)
-                # PoolTrainingWorker has worker_stats signal
-                if hasattr(self.worker, 'worker_stats'):
-                    self.worker.worker_stats.disconnect(self._on_worker_stats)
-            except TypeError:
-                pass  # Already disconnected
+        self._teardown_worker()
 
         # Reset worker status in table
-        for i in range(self.worker_table.rowCount()):
-            item = self.worker_table.item(i, 2)
-            if item:
-                status = item.text()
+        with _frozen(self.worker_table):
+            for i in range(self.worker_model.rowCount()):
+                status = self.worker_model.cell(i, WorkerTableModel.COL_STATUS)
                 if "Initializing" in status or "items" in status:
-                    item.setText("Done")
+                    self.worker_model.update_status(i, "Done")
 
         # Create/update manifest.json for the JMEM pack
-        jmem_path = Path(self.jmem_path_edit.text())
-        if jmem_path.exists():
+        jmem_path = self._jmem_path_cache
+        if jmem_path is not None and jmem_path.exists():
             jcur_name = self.jcur_combo.currentText() if self.jcur_combo.currentIndex() >= 0 else None
             manifest = create_or_update_manifest(
                 jmem_path, jcur_name,
@@ -2043,69 +2829,49 @@ class JmemCreatorWindow(QMainWindow):
             )
             self._log(f"Updated manifest: {manifest.get('total_memories', 0)} memories indexed")
             if self.selected_base_jmems:
-                self._log(f"Dependencies recorded: {[Path(p).name for p in self.selected_base_jmems]}")
+                self._log(f"Dependencies recorded: {[os.path.basename(p) for p in self.selected_base_jmems]}")
 
         self._update_button_states()
 
-        # Clean up worker and brain to prevent memory leak
-        try:
-            from JiYouBrain.brain import JiyouBrain
-            JiyouBrain.clear_instance()
-        except Exception:
-            pass
-
-        if self.worker:
-            self.worker.deleteLater()
-            self.worker = None
-
-        import gc
-        gc.collect()
-
     def _on_training_error(self, error: str):
         """Handle training error."""
+        if self._is_stale_signal():
+            return
         self._stop_elapsed_timer()
+        self._progress_timer.stop()
         self._log(f"ERROR: {error}")
-        QMessageBox.critical(self, "Training Error", error)
-
-        # Disconnect worker signals to prevent memory leak
-        if self.worker:
-            try:
-                self.worker.log_message.disconnect(self._log)
-                self.worker.progress_update.disconnect(self._on_progress_update)
-                self.worker.stats_update.disconnect(self._on_stats_update)
-                self.worker.training_finished.disconnect(self._on_training_finished)
-                self.worker.training_error.disconnect(self._on_training_error)
-            except TypeError:
-                pass  # Already disconnected
-
+        self._teardown_worker()
         self._update_button_states()
-
-        # Clean up worker and brain to prevent memory leak
-        try:
-            from JiYouBrain.brain import JiyouBrain
-            JiyouBrain.clear_instance()
-        except Exception:
-            pass
-
-        if self.worker:
-            self.worker.deleteLater()
-            self.worker = None
-
-        import gc
-        gc.collect()
+        QMessageBox.critical(self, "Training Error", error)
 
     def _update_button_states(self):
+        """Schedule a button state refresh (calls within one event-loop pass coalesce)."""
+        if self._button_update_pending:
+            return
+        self._button_update_pending = True
+        QTimer.singleShot(0, self._apply_button_states)
+
+    def _apply_button_states(self):
         """Update button enabled states based on worker status and brain availability."""
+        self._button_update_pending = False
         running = bool(self.worker and self.worker.isRunning())
         paused = bool(running and hasattr(self.worker, 'is_paused') and self.worker.is_paused)
         brain_loaded = self.brain_dir is not None
+        has_workers = len(self.worker_configs) > 0
+        supports_pause = hasattr(self.worker, 'pause') if self.worker else False
+        has_presets = self.preset_combo.count() > 0
+        has_base_list = self.base_jmems_list is not None
+
+        # Every flag below derives from these; skip ~25 setEnabled calls if none changed
+        state = (running, paused, brain_loaded, has_workers, supports_pause, has_presets, has_base_list)
+        if state == self._button_state:
+            return
+        self._button_state = state
 
         # Start requires brain to be loaded and at least one worker configured
-        has_workers = len(self.worker_configs) > 0
         self.start_btn.setEnabled(not running and brain_loaded and has_workers)
 
         # Pause/Resume - only supported with TrainingWorker, not PoolTrainingWorker
-        supports_pause = hasattr(self.worker, 'pause') if self.worker else False
         self.pause_btn.setEnabled(running and not paused and supports_pause)
         self.resume_btn.setEnabled(paused and supports_pause)
         self.stop_btn.setEnabled(running)
@@ -2119,7 +2885,8 @@ class JmemCreatorWindow(QMainWindow):
         self.pdf_browse_btn.setEnabled(not running and brain_loaded)
 
         # Base JMEMs - requires brain
-        self.base_jmems_list.setEnabled(not running and brain_loaded)
+        if self.base_jmems_list is not None:
+            self.base_jmems_list.setEnabled(not running and brain_loaded)
         self.add_base_btn.setEnabled(not running and brain_loaded)
         self.remove_base_btn.setEnabled(not running and brain_loaded)
         self.auto_add_btn.setEnabled(not running and brain_loaded)
@@ -2134,29 +2901,52 @@ class JmemCreatorWindow(QMainWindow):
         self.remove_worker_btn.setEnabled(not running and has_workers)
         self.clear_workers_btn.setEnabled(not running and has_workers)
         self.preset_combo.setEnabled(not running)
-        self.load_preset_btn.setEnabled(not running and self.preset_combo.count() > 0)
+        self.load_preset_btn.setEnabled(not running and has_presets)
         self.save_preset_btn.setEnabled(not running)
-        self.delete_preset_btn.setEnabled(not running and self.preset_combo.count() > 0)
+        self.delete_preset_btn.setEnabled(not running and has_presets)
         # Keep table enabled for scrolling, just disable selection during training
         self.worker_table.setSelectionMode(
-            QTableWidget.NoSelection if running else QTableWidget.SingleSelection
+            QAbstractItemView.NoSelection if running else QAbstractItemView.SingleSelection
         )
 
     def _log(self, msg: str):
-        """Add message to log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.appendPlainText(f"[{timestamp}] {msg}")
+        """Queue message for the log (timestamped and appended by _flush_log)."""
+        self._log_queue.append((int(time.time()), msg))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        """Append all queued log lines in a single document update."""
+        if not self._log_queue:
+            return
+        batch = "\n".join(f"[{_clock_text(t)}] {msg}" for t, msg in self._log_queue)
+        self._log_queue.clear()
+        self.log_text.appendPlainText(batch)
+
+    def _confirm(self, title: str, text: str, on_yes):
+        """Ask a Yes/No question without a nested event loop; calls on_yes() on Yes."""
+        box = QMessageBox(QMessageBox.Question, title, text, QMessageBox.Yes | QMessageBox.No, self)
+        box.setDefaultButton(QMessageBox.No)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda result: on_yes() if result == QMessageBox.Yes else None)
+        box.open()
+
+    def _confirm_close(self):
+        """Close for real once the user confirmed stopping training."""
+        self._close_confirmed = True
+        self.close()
 
     def closeEvent(self, event):
         """Handle window close."""
         if self.worker and self.worker.isRunning():
-            reply = QMessageBox.question(
-                self, "Confirm Exit",
-                "Training is in progress. Stop and exit?",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            if reply == QMessageBox.No:
+            if not self._close_confirmed:
+                # Ask asynchronously; _confirm_close() re-enters close() on Yes
                 event.ignore()
+                self._confirm(
+                    "Confirm Exit",
+                    "Training is in progress. Stop and exit?",
+                    self._confirm_close,
+                )
                 return
 
             self.worker.stop()
@@ -2164,19 +2954,16 @@ class JmemCreatorWindow(QMainWindow):
 
         # Clean up brain singleton to release memory
         try:
-            from JiYouBrain.brain import JiyouBrain
-            JiyouBrain.clear_instance()
+            if JiyouBrain is not None:
+                JiyouBrain.clear_instance()
         except Exception:
             pass
 
-        # Save settings (including window geometry)
+        # Save settings (including window geometry) and let the write finish
         self._save_settings()
+        QThreadPool.globalInstance().waitForDone(5000)
 
-        # Force garbage collection
-        gc.collect()
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-
+        # No forced gc/empty_cache: the OS reclaims host and GPU memory on exit
         event.accept()
 
 